@@ -14,6 +14,12 @@ methods to identify connected regions, calculate their boundaries, and determine
 total fencing costs.
 """
 
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+from scipy.ndimage import label
+
 from aoc.models.base import SolutionBase
 
 
@@ -25,122 +31,115 @@ class Solution(SolutionBase):
     - Part 2: Calculate total cost using distinct sides-based pricing
     """
 
-    def find_region(
-        self, grid: list[list[str]], start_x: int, start_y: int, char: str, visited: set
-    ) -> set[tuple[int, int]]:
-        """Find all connected cells containing the same character using depth-first search.
+    STRUCTURE: ClassVar[npt.NDArray[np.bool_]] = np.array(
+        [[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=np.bool_
+    )
+
+    def label_regions(self, grid: npt.NDArray[np.uint8]) -> tuple[npt.NDArray[np.int32], int]:
+        """Label every connected region of identical plants across the garden.
+
+        Runs connected-component labelling once per distinct plant type using a
+        4-connected structuring element, offsetting each pass so that labels are
+        unique across the whole garden.
 
         Args:
-            grid: 2D list representing the garden layout
-            start_x: Starting x-coordinate to explore from
-            start_y: Starting y-coordinate to explore from
-            char: Character type to match for region
-            visited: Set of already visited coordinates
+            grid: 2D byte array representing the garden layout
 
         Returns
         -------
-            Set of (y, x) coordinates that form the connected region
+            Tuple of the label grid (regions numbered from 1) and the number of regions
         """
-        rows, cols = len(grid), len(grid[0])
-        if (
-            not (0 <= start_x < cols and 0 <= start_y < rows)
-            or grid[start_y][start_x] != char
-            or (start_y, start_x) in visited
-        ):
-            return set()
-
-        region = set()
-        stack = [(start_y, start_x)]
-
-        while stack:
-            y, x = stack.pop()
-            if (y, x) in visited:
-                continue
-
-            visited.add((y, x))
-            region.add((y, x))
-
-            for dy, dx in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                new_y, new_x = y + dy, x + dx
-                if (
-                    0 <= new_x < cols
-                    and 0 <= new_y < rows
-                    and grid[new_y][new_x] == char
-                    and (new_y, new_x) not in visited
-                ):
-                    stack.append((new_y, new_x))
-
-        return region
-
-    def calculate_perimeter(self, region: set[tuple[int, int]], rows: int, cols: int) -> int:
-        """Calculate the total perimeter of a region.
-
-        Counts each cell edge that either borders the grid boundary or
-        neighbors a different plant type.
+        labels = np.zeros(grid.shape, dtype=np.int32)
+        next_id = 0
+
+        for char in np.unique(grid):
+            mask = grid == char
+            components, count = label(mask, structure=self.STRUCTURE)
+            labels[mask] = components[mask] + next_id
+            next_id += count
+
+        return labels, next_id
+
+    def calculate_perimeter(
+        self, labels: npt.NDArray[np.int32], count: int
+    ) -> npt.NDArray[np.intp]:
+        """Calculate the total perimeter of every region at once.
+
+        Counts each cell edge that either borders the grid boundary or neighbors a
+        different region. Every cell starts with four edges, and each pair of
+        adjacent cells sharing a label hides one edge from both of them, so the
+        perimeter is `4 * area - 2 * shared`. Shared edges come from one boolean
+        equality mask per direction, credited to their region with `np.bincount`.
 
         Args:
-            region: Set of (y, x) coordinates in the region
-            rows: Number of rows in the grid
-            cols: Number of columns in the grid
+            labels: Label grid with regions numbered from 1
+            count: Number of labelled regions
 
         Returns
         -------
-            Total length of the perimeter
+            Perimeter of each region, indexed by label
         """
-        perimeter = 0
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        perimeter = 4 * np.bincount(labels.ravel(), minlength=count + 1)
 
-        for y, x in region:
-            for dy, dx in directions:
-                new_y, new_x = y + dy, x + dx
-                if not (0 <= new_x < cols and 0 <= new_y < rows and (new_y, new_x) in region):
-                    perimeter += 1
+        for a, b in ((labels[:, :-1], labels[:, 1:]), (labels[:-1, :], labels[1:, :])):
+            perimeter -= 2 * np.bincount(a[a == b], minlength=count + 1)
 
         return perimeter
 
-    def count_sides(self, region: set[tuple[int, int]], rows: int, cols: int) -> int:
-        """Count unique sides of a region, merging adjacent parallel edges.
+    def count_sides(self, labels: npt.NDArray[np.int32], count: int) -> npt.NDArray[np.intp]:
+        """Count unique sides of every region, merging adjacent parallel edges.
 
         A side is a continuous straight line segment that forms part of the region's
         boundary, regardless of its length. Multiple adjacent cell edges in the same
         direction count as a single side.
 
+        A polygon has as many sides as corners, so each cell checks its four corners
+        against the label grid: a corner is convex when both orthogonal neighbours
+        belong to another region, and concave when both belong to the same region
+        but the diagonal neighbour does not.
+
         Args:
-            region: Set of (y, x) coordinates in the region
-            rows: Number of rows in the grid
-            cols: Number of columns in the grid
+            labels: Label grid with regions numbered from 1
+            count: Number of labelled regions
 
         Returns
         -------
-            Number of distinct sides in the region's boundary
+            Number of distinct sides of each region, indexed by label
         """
-        edges = set()
-
-        for y, x in region:
-            north = (y - 1, x) in region
-            east = (y, x + 1) in region
-            south = (y + 1, x) in region
-            west = (y, x - 1) in region
+        padded = np.pad(labels, 1)
+        center = padded[1:-1, 1:-1]
+        sides = np.zeros(count + 1, dtype=np.intp)
 
-            if not north and (not west or (y - 1, x - 1) in region):
-                edges.add(("H", y, x))
+        for dy, dx in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+            vertical = self.shifted(padded, dy, 0) == center
+            horizontal = self.shifted(padded, 0, dx) == center
+            diagonal = self.shifted(padded, dy, dx) == center
+            corner = (~vertical & ~horizontal) | (vertical & horizontal & ~diagonal)
+            sides += np.bincount(center[corner], minlength=count + 1)
 
-            if not south and (not west or (y + 1, x - 1) in region):
-                edges.add(("H", y + 1, x))
+        return sides
 
-            if not west and (not north or (y - 1, x - 1) in region):
-                edges.add(("V", x, y))
+    def shifted(self, padded: npt.NDArray[np.int32], dy: int, dx: int) -> npt.NDArray[np.int32]:
+        """View of a once-padded grid aligned so each cell sees its (dy, dx) neighbour.
 
-            if not east and (not north or (y - 1, x + 1) in region):
-                edges.add(("V", x + 1, y))
+        Args:
+            padded: Label grid padded by one cell on every side
+            dy: Row offset of the neighbour (-1, 0 or 1)
+            dx: Column offset of the neighbour (-1, 0 or 1)
 
-        return len(edges)
+        Returns
+        -------
+            Array with the shape of the unpadded grid holding each cell's neighbour
+        """
+        rows, cols = padded.shape
+        return padded[1 + dy : rows - 1 + dy, 1 + dx : cols - 1 + dx]
 
     def calculate_cost(self, data: list[str], calc_method: str) -> int:
         """Process the garden grid and calculate total fencing cost.
 
-        For each unique plant type, identifies all connected regions and calculates
-        their price based on area multiplied by either perimeter or number of sides.
+        Labels all connected regions up front and calculates their price based on
+        area multiplied by either perimeter or number of sides. Every metric is
+        counted over the whole label grid and indexed by region label.
 
         Args:
             data: List of strings representing the garden grid
@@ -150,27 +149,17 @@ class Solution(SolutionBase):
         -------
             Total cost of fencing all regions
         """
-        grid = [list(line) for line in data]
-        rows, cols = len(grid), len(grid[0])
-        visited: set = set()
-        total_price = 0
-
-        for y in range(rows):
-            for x in range(cols):
-                if (y, x) not in visited:
-                    char = grid[y][x]
-                    region = self.find_region(grid, x, y, char, visited)
-
-                    if region:
-                        if calc_method == "perimeter":
-                            metric = self.calculate_perimeter(region, rows, cols)
+        grid = np.frombuffer("".join(data).encode(), dtype=np.uint8).reshape(len(data), -1)
+        labels, count = self.label_regions(grid)
+        areas = np.bincount(labels.ravel(), minlength=count + 1)
 
-                        else:
-                            metric = self.count_sides(region, rows, cols)
+        if calc_method == "perimeter":
+            metric = self.calculate_perimeter(labels, count)
 
-                        total_price += len(region) * metric
+        else:
+            metric = self.count_sides(labels, count)
 
-        return total_price
+        return int(areas @ metric)
 
     def part1(self, data: list[str]) -> int:
         """Calculate total fencing cost using perimeter-based pricing.
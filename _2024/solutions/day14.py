@@ -16,6 +16,9 @@ various spatial puzzles.
 
 from typing import NamedTuple
 
+import numpy as np
+import numpy.typing as npt
+
 from aoc.models.base import SolutionBase
 
 
@@ -91,25 +94,47 @@ class Solution(SolutionBase):
         """
         return (11, 7) if len(robots) == 12 else (101, 103)
 
-    def get_position_at_time(self, robot: Robot, time: int, width: int, height: int) -> Position:
-        """Calculate a robot's position after a given amount of time.
+    def to_arrays(self, robots: list[Robot]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Stack robot positions and velocities into `(N, 2)` arrays.
+
+        Args:
+            robots: List of Robot objects
+
+        Returns
+        -------
+            Tuple of (positions, velocities) arrays with one `(x, y)` row per robot
+        """
+        positions = np.array([robot.pos for robot in robots], dtype=np.int64)
+        velocities = np.array([robot.velocity for robot in robots], dtype=np.int64)
+        return positions, velocities
+
+    def get_positions_at_time(
+        self,
+        positions: npt.NDArray[np.int64],
+        velocities: npt.NDArray[np.int64],
+        time: int,
+        width: int,
+        height: int,
+    ) -> npt.NDArray[np.int64]:
+        """Calculate every robot's position after a given amount of time.
 
         Handles wrapping movement where robots that move beyond grid boundaries
-        appear on the opposite side.
+        appear on the opposite side. All robots are advanced with a single
+        broadcasted multiply-add and modulo.
 
         Args:
-            robot: Robot object with initial position and velocity
+            positions: `(N, 2)` array of initial robot positions
+            velocities: `(N, 2)` array of robot velocities
             time: Number of time steps to simulate
             width: Grid width
             height: Grid height
 
         Returns
         -------
-            Position representing robot's location after specified time
+            `(N, 2)` array of robot locations after specified time
         """
-        x = (robot.pos.x + time * robot.velocity.x) % width
-        y = (robot.pos.y + time * robot.velocity.y) % height
-        return Position(x, y)
+        dims = np.array([width, height], dtype=np.int64)
+        return (positions + time * velocities) % dims
 
     def part1(self, data: list[str]) -> int:
         """Calculate product of robots in each quadrant after 100 time steps.
@@ -128,40 +153,62 @@ class Solution(SolutionBase):
         width, height = self.get_grid_size(robots)
         mid_x, mid_y = width // 2, height // 2
 
-        quads = [0] * 4
-        for robot in robots:
-            pos = self.get_position_at_time(robot, 100, width, height)
-            if pos.x == mid_x or pos.y == mid_y:
-                continue
+        positions, velocities = self.to_arrays(robots)
+        pos = self.get_positions_at_time(positions, velocities, 100, width, height)
+        xs, ys = pos[:, 0], pos[:, 1]
+
+        off_center = (xs != mid_x) & (ys != mid_y)
+        quad_idx = (xs > mid_x).astype(np.intp) + (ys > mid_y).astype(np.intp) * 2
+        quads = np.bincount(quad_idx[off_center], minlength=4)
 
-            quad_idx = (int(pos.x > mid_x)) + (int(pos.y > mid_y) * 2)
-            quads[quad_idx] += 1
+        return int(quads.prod())
 
-        return quads[0] * quads[1] * quads[2] * quads[3]
+    def find_clustered_offset(
+        self, starts: npt.NDArray[np.int64], steps: npt.NDArray[np.int64], period: int
+    ) -> int:
+        """Find the time offset within one period where a coordinate is most clustered.
+
+        Each axis wraps independently, so the robots' x-coordinates repeat every
+        `width` steps and their y-coordinates every `height` steps. The offset with
+        the lowest variance is where the robots bunch up along that axis.
+
+        All offsets are evaluated at once as a `(period, N)` matrix of coordinates,
+        so the variance of every row comes from a single reduction.
+
+        Args:
+            starts: Initial coordinate of every robot along one axis
+            steps: Velocity of every robot along the same axis
+            period: Grid size along that axis
+
+        Returns
+        -------
+            Offset in `range(period)` with the minimum coordinate variance
+        """
+        times = np.arange(period, dtype=np.int64)[:, np.newaxis]
+        coords = (starts[np.newaxis, :] + times * steps[np.newaxis, :]) % period
+        return int(coords.var(axis=1).argmin())
 
     def part2(self, data: list[str]) -> int:
-        """Find first time when robots collide.
+        """Find the first time the robots arrange themselves into a picture.
 
-        Simulates robot movement until two or more robots occupy the same position,
-        indicating a collision.
+        When the robots form the Christmas tree they are clustered along both axes
+        at once. The x-axis repeats every `width` steps and the y-axis every
+        `height` steps, so the best offset is found separately for each axis and
+        the two are combined with the Chinese remainder theorem:
+        `t = tx (mod width)` and `t = ty (mod height)`.
 
         Args:
             data: List of strings containing robot configurations
 
         Returns
         -------
-            Time step when the first collision occurs
+            Time step when the robots are most tightly clustered
         """
         robots = self.parse_data(data)
         width, height = self.get_grid_size(robots)
+        positions, velocities = self.to_arrays(robots)
 
-        for time in range(1, 10000):
-            positions = set()
-            for robot in robots:
-                pos = self.get_position_at_time(robot, time, width, height)
-                if pos in positions:
-                    return time
-
-                positions.add(pos)
+        tx = self.find_clustered_offset(positions[:, 0], velocities[:, 0], width)
+        ty = self.find_clustered_offset(positions[:, 1], velocities[:, 1], height)
 
-        return -1
+        return tx + width * ((ty - tx) * pow(width, -1, height) % height)
@@ -7,9 +7,30 @@ determining which sequences are possible to create and counting
 the total number of unique ways to arrange towels for each sequence.
 """
 
+from collections import deque
+from typing import NamedTuple
+
 from aoc.models.base import SolutionBase
 
 
+class Automaton(NamedTuple):
+    """Aho-Corasick automaton over towel patterns.
+
+    Attributes
+    ----------
+        symbols: 256-byte translation table mapping stripe bytes to dense symbols
+        width: Number of symbols, including the catch-all for unknown bytes
+        transitions: Flat table where `transitions[state * width + symbol]` is the
+            next state
+        outputs: Lengths of every towel pattern that ends in each state
+    """
+
+    symbols: bytes
+    width: int
+    transitions: list[int]
+    outputs: list[tuple[int, ...]]
+
+
 class Solution(SolutionBase):
     """Solution for Advent of Code 2024 - Day 19: Linen Layout.
 
@@ -39,33 +60,96 @@ class Solution(SolutionBase):
         sequences = [row for row in parts[1].split("\n") if row]
         return towels, sequences
 
-    def count_ways(self, seq: str, towels: list[str], cache: dict[str, int]) -> int:
-        """Count number of unique ways to arrange towels to match a sequence.
+    def build_automaton(self, towels: list[str]) -> Automaton:
+        """Compile all towel patterns into an Aho-Corasick automaton.
 
-        Uses dynamic programming with memoization to efficiently count arrangements.
+        A trie of the towels is built first, then a breadth-first pass adds failure
+        links and folds them into a complete transition table, so every state has a
+        successor for every stripe colour. Each state also lists the lengths of all
+        towels that end there, including those reached through its failure chain.
+
+        Stripe colours are renumbered densely; any byte that appears in no towel
+        maps to one extra symbol that always returns to the root.
 
         Args:
-            seq: Target sequence to match
             towels: Available towel patterns
-            cache: Memoization cache
 
         Returns
         -------
-            Number of unique ways to arrange towels to match sequence
+            Automaton with its symbol table, flat transitions and per-state outputs
         """
-        if not seq:
-            return 1
+        alphabet = sorted(set("".join(towels).encode()))
+        width = len(alphabet) + 1
+        table = bytearray([len(alphabet)]) * 256
+        for symbol, char in enumerate(alphabet):
+            table[char] = symbol
+
+        children: list[dict[int, int]] = [{}]
+        lengths = [0]
+        for towel in towels:
+            node = 0
+            for symbol in towel.encode().translate(table):
+                if symbol not in children[node]:
+                    children[node][symbol] = len(children)
+                    children.append({})
+                    lengths.append(0)
 
-        if seq in cache:
-            return cache[seq]
+                node = children[node][symbol]
 
-        total = 0
-        for towel in towels:
-            if seq.startswith(towel):
-                total += self.count_ways(seq[len(towel) :], towels, cache)
+            lengths[node] = len(towel)
+
+        transitions = [0] * (len(children) * width)
+        outputs: list[tuple[int, ...]] = [()] * len(children)
+        fail = [0] * len(children)
+        queue = deque([0])
+
+        while queue:
+            node = queue.popleft()
+            own = (lengths[node],) if lengths[node] else ()
+            outputs[node] = own + outputs[fail[node]] if node else ()
+
+            for symbol in range(width):
+                child = children[node].get(symbol)
+                fallback = transitions[fail[node] * width + symbol] if node else 0
+                if child is None:
+                    transitions[node * width + symbol] = fallback
+                    continue
+
+                transitions[node * width + symbol] = child
+                fail[child] = fallback
+                queue.append(child)
+
+        return Automaton(bytes(table), width, transitions, outputs)
+
+    def count_ways(self, seq: bytes, automaton: Automaton, dp: list[int]) -> int:
+        """Count number of unique ways to arrange towels to match a sequence.
+
+        Runs a dynamic programme where `dp[i]` holds the number of ways to build the
+        first `i` stripes. The sequence is scanned once through the automaton, one
+        table lookup per stripe; every towel of length `k` ending at position `i`
+        contributes `dp[i - k]` to `dp[i]`.
+
+        Each `dp[i]` is assigned exactly once, so the caller's buffer can be reused
+        across sequences without clearing it.
+
+        Args:
+            seq: Target sequence to match, encoded as bytes
+            automaton: Towel automaton, from `build_automaton`
+            dp: Preallocated buffer with room for at least `len(seq) + 1` counts
+
+        Returns
+        -------
+            Number of unique ways to arrange towels to match sequence
+        """
+        transitions, outputs, width = automaton.transitions, automaton.outputs, automaton.width
+        dp[0] = 1
+        state = 0
+
+        for i, symbol in enumerate(seq.translate(automaton.symbols), 1):
+            state = transitions[state * width + symbol]
+            dp[i] = sum(dp[i - length] for length in outputs[state])
 
-        cache[seq] = total
-        return total
+        return dp[len(seq)]
 
     def part1(self, data: list[str]) -> int:
         """Count possible towel pattern sequences.
@@ -80,9 +164,10 @@ class Solution(SolutionBase):
             Number of sequences that can be created
         """
         towels, sequences = self.parse_data(data)
-        cache: dict[str, int] = {}
+        automaton = self.build_automaton(towels)
+        dp = [0] * (max(map(len, sequences)) + 1)
 
-        return sum(1 for seq in sequences if self.count_ways(seq, towels, cache) > 0)
+        return sum(1 for seq in sequences if self.count_ways(seq.encode(), automaton, dp) > 0)
 
     def part2(self, data: list[str]) -> int:
         """Sum all possible arrangement combinations across sequences.
@@ -97,6 +182,7 @@ class Solution(SolutionBase):
             Total sum of possible arrangement combinations
         """
         towels, sequences = self.parse_data(data)
-        cache: dict[str, int] = {}
+        automaton = self.build_automaton(towels)
+        dp = [0] * (max(map(len, sequences)) + 1)
 
-        return sum(self.count_ways(seq, towels, cache) for seq in sequences)
+        return sum(self.count_ways(seq.encode(), automaton, dp) for seq in sequences)
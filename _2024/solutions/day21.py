@@ -9,178 +9,237 @@ two different keypads - one with digits and one with directional symbols.
 Each robot interprets the previous robot's movements, creating progressively
 more complex translations through the chain.
 
-The module contains a Solution class that inherits from SolutionBase and
-implements methods to calculate movement complexity for chains of different lengths.
+Keypad moves and the cost of every key transition at every robot chain depth
+depend only on the fixed keypad layouts, so they are computed once at import
+time as module-level tables. The module contains a Solution class that inherits
+from SolutionBase and sums those tables to score codes for chains of different
+lengths.
 """
 
 from collections import defaultdict
-from itertools import pairwise, product
-from typing import Any, ClassVar
+from itertools import product
+
+import numpy as np
+import numpy.typing as npt
 
 from aoc.models.base import SolutionBase
 
 
-class Solution(SolutionBase):
-    """Robot movement translation through keypad chains.
+NUMERIC_KEYPAD = ["789", "456", "123", "#0A"]
+DIRECTIONAL_KEYPAD = ["#^A", "<v>"]
+NUMERIC_INDEX = {key: idx for idx, key in enumerate("0123456789A")}
+DIRECTIONAL_INDEX = {key: idx for idx, key in enumerate("^v<>A")}
+MAX_DEPTH = 25
 
-    This solution implements robot translation algorithms:
-    - Part 1: Calculate movement complexity with 2-robot chains
-    - Part 2: Calculate movement complexity with 25-robot chains
+
+def _add_move(moves: dict[tuple[str, str], list[str]], key1: str, key2: str, movement: str) -> None:
+    """Add a valid movement sequence between two keys to the moves dictionary.
+
+    Args:
+        moves: Dictionary mapping key pairs to their valid movement sequences
+        key1: Starting key position
+        key2: Target key position
+        movement: String of directional moves (combination of ^v<>)
     """
+    if key1 != "#" and key2 != "#" and key1 != key2:
+        moves[(key1, key2)].append(movement + "A")
 
-    numeric_keypad: ClassVar[list[str]] = ["789", "456", "123", "#0A"]
-    directional_keypad: ClassVar[list[str]] = ["#^A", "<v>"]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initialize the solution with empty move dictionaries and translation cache."""
-        super().__init__(*args, **kwargs)
-        self.moves1: dict[tuple[str, str], list[str]] = {}
-        self.moves2: dict[tuple[str, str], list[str]] = {}
-        self.translation_cache: dict[tuple[str, int], int] = {}
+def _parse_moves(keypad_layout: list[str]) -> dict[tuple[str, str], list[str]]:
+    """Generate all possible moves between keys on a given keypad layout.
 
-    def add_move(
-        self, moves: dict[tuple[str, str], list[str]], key1: str, key2: str, movement: str
-    ) -> None:
-        """Add a valid movement sequence between two keys to the moves dictionary.
+    Maps out every valid movement sequence between pairs of keys, considering:
+    - Direct horizontal moves using < and >
+    - Direct vertical moves using ^ and v
+    - Diagonal moves trying both horizontal-then-vertical and vertical-then-horizontal
+    - Avoiding the '#' obstacle and invalid positions
 
-        Args:
-            moves: Dictionary mapping key pairs to their valid movement sequences
-            key1: Starting key position
-            key2: Target key position
-            movement: String of directional moves (combination of ^v<>)
-        """
-        if key1 != "#" and key2 != "#" and key1 != key2:
-            moves[(key1, key2)].append(movement + "A")
+    Args:
+        keypad_layout: List of strings representing rows of the keypad
 
-    def parse_moves(self, keypad_layout: list[str]) -> dict[tuple[str, str], list[str]]:
-        """Generate all possible moves between keys on a given keypad layout.
+    Returns
+    -------
+        Dictionary mapping key pairs (start, end) to lists of valid movement sequences
+    """
+    positions = {key: (r, c) for r, row in enumerate(keypad_layout) for c, key in enumerate(row)}
+
+    moves: dict[tuple[str, str], list[str]] = defaultdict(list)
+    keys = sorted(positions.keys())
+
+    for key1, key2 in product(keys, repeat=2):
+        if key1 == "#" or key2 == "#" or key1 == key2:
+            continue
+
+        r1, c1 = positions[key1]
+        r2, c2 = positions[key2]
+        r_hash, c_hash = positions["#"]
+
+        if r1 == r2:
+            _add_move(moves, key1, key2, (">" if c2 > c1 else "<") * abs(c2 - c1))
+
+        elif c1 == c2:
+            _add_move(moves, key1, key2, ("v" if r2 > r1 else "^") * abs(r2 - r1))
+
+        else:
+            if r1 != r_hash or c2 != c_hash:
+                _add_move(
+                    moves,
+                    key1,
+                    key2,
+                    (">" if c2 > c1 else "<") * abs(c2 - c1)
+                    + ("v" if r2 > r1 else "^") * abs(r2 - r1),
+                )
+
+            if c1 != c_hash or r2 != r_hash:
+                _add_move(
+                    moves,
+                    key1,
+                    key2,
+                    ("v" if r2 > r1 else "^") * abs(r2 - r1)
+                    + (">" if c2 > c1 else "<") * abs(c2 - c1),
+                )
+
+    return moves
+
+
+def _key_moves(moves: dict[tuple[str, str], list[str]], key1: str, key2: str) -> list[str]:
+    """Return the movement sequences from one key to another, including staying put.
+
+    Args:
+        moves: Dictionary mapping key pairs to their valid movement sequences
+        key1: Starting key position
+        key2: Target key position
+
+    Returns
+    -------
+        Valid movement sequences, or just a press of 'A' when both keys match
+    """
+    return moves[(key1, key2)] if key1 != key2 else ["A"]
 
-        Maps out every valid movement sequence between pairs of keys, considering:
-        - Direct horizontal moves using < and >
-        - Direct vertical moves using ^ and v
-        - Diagonal moves trying both horizontal-then-vertical and vertical-then-horizontal
-        - Avoiding the '#' obstacle and invalid positions
 
-        Args:
-            keypad_layout: List of strings representing rows of the keypad
+def _encode_moves(
+    moves: dict[tuple[str, str], list[str]], index: dict[str, int]
+) -> list[list[list[npt.NDArray[np.intp]]]]:
+    """Intern a keypad's movement sequences into integer-indexed tables.
 
-        Returns
-        -------
-            Dictionary mapping key pairs (start, end) to lists of valid movement sequences
-        """
-        positions = {
-            key: (r, c) for r, row in enumerate(keypad_layout) for c, key in enumerate(row)
-        }
-
-        moves: dict[tuple[str, str], list[str]] = defaultdict(list)
-        keys = sorted(positions.keys())
-
-        for key1, key2 in product(keys, repeat=2):
-            if key1 == "#" or key2 == "#" or key1 == key2:
-                continue
-
-            r1, c1 = positions[key1]
-            r2, c2 = positions[key2]
-            r_hash, c_hash = positions["#"]
-
-            if r1 == r2:
-                self.add_move(moves, key1, key2, (">" if c2 > c1 else "<") * abs(c2 - c1))
-
-            elif c1 == c2:
-                self.add_move(moves, key1, key2, ("v" if r2 > r1 else "^") * abs(r2 - r1))
-
-            else:
-                if r1 != r_hash or c2 != c_hash:
-                    self.add_move(
-                        moves,
-                        key1,
-                        key2,
-                        (">" if c2 > c1 else "<") * abs(c2 - c1)
-                        + ("v" if r2 > r1 else "^") * abs(r2 - r1),
-                    )
-
-                if c1 != c_hash or r2 != r_hash:
-                    self.add_move(
-                        moves,
-                        key1,
-                        key2,
-                        ("v" if r2 > r1 else "^") * abs(r2 - r1)
-                        + (">" if c2 > c1 else "<") * abs(c2 - c1),
-                    )
-
-        return moves
-
-    def build_combinations(self, arrays: list[list[str]]) -> list[tuple[str, ...]]:
-        """Generate all possible combinations of movement sequences.
+    The result is indexed by the integer ids of the start and target keys. Each
+    movement sequence is stored as an array of directional key indices with a
+    leading 'A', so consecutive entries are the transitions the next robot up
+    the chain has to make.
 
-        Args:
-            arrays: List of lists where each inner list contains possible movements
-                   for a single step in the sequence
+    Args:
+        moves: Dictionary mapping key pairs to their valid movement sequences
+        index: Mapping from this keypad's keys to their integer ids
 
-        Returns
-        -------
-            List of all possible movement sequence combinations
-        """
-        return list(product(*arrays))
+    Returns
+    -------
+        Nested lists `table[key1][key2]` of encoded movement sequences
+    """
+    keys = sorted(index, key=index.__getitem__)
+    start = [DIRECTIONAL_INDEX["A"]]
+    return [
+        [
+            [
+                np.array(start + [DIRECTIONAL_INDEX[char] for char in move], dtype=np.intp)
+                for move in _key_moves(moves, key1, key2)
+            ]
+            for key2 in keys
+        ]
+        for key1 in keys
+    ]
+
+
+def _keypad_cost(move: npt.NDArray[np.intp], costs: npt.NDArray[np.int64]) -> int:
+    """Price an encoded directional move using one level of the cost table.
+
+    Args:
+        move: Directional key indices to input, starting with 'A'
+        costs: `(5, 5)` cost table level indexed by directional key ids
+
+    Returns
+    -------
+        Number of presses needed to input the move
+    """
+    return int(costs[move[:-1], move[1:]].sum())
 
-    def translate_numpad(self, code: str) -> list[tuple[str, ...]]:
-        """Convert a numeric code into possible movement sequences.
 
-        Args:
-            code: String of numeric characters to translate
+def _build_cost_table(depth: int) -> npt.NDArray[np.int64]:
+    """Precompute the cost of every directional key transition at every depth.
 
-        Returns
-        -------
-            List of possible movement sequence combinations to input the code
-        """
-        code = "A" + code
-        moves = [self.moves1[(a, b)] for a, b in pairwise(code)]
-        return self.build_combinations(moves)
+    `table[d, a, b]` is the number of presses the human needs so that the
+    directional robot `d` levels above them moves from key `a` to key `b` and
+    presses it. Level `0` is the human, who presses each key exactly once; every
+    further level picks the cheapest movement sequence and prices it with the
+    level below, so the whole chain is just `depth` passes over 25 key pairs.
 
-    def translate_keypad(self, code: str) -> list[tuple[str, ...]]:
-        """Convert a directional code into possible movement sequences.
+    Args:
+        depth: Number of directional robots in the chain
 
-        Args:
-            code: String of directional characters to translate
+    Returns
+    -------
+        Array of shape `(depth + 1, 5, 5)` holding press counts
+    """
+    size = len(DIRECTIONAL_INDEX)
+    table = np.ones((depth + 1, size, size), dtype=np.int64)
+
+    for level in range(1, depth + 1):
+        for a, b in product(range(size), repeat=2):
+            table[level, a, b] = min(
+                _keypad_cost(move, table[level - 1]) for move in DIRECTIONAL_MOVES[a][b]
+            )
+
+    return table
+
+
+def _build_numeric_costs(costs: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Price every numeric key transition once for a given chain depth.
+
+    Every robot returns to 'A' after each press, so the choice of movement
+    sequence for one key transition never affects another. Each numeric key
+    pair can therefore be priced independently and reused by every code.
+
+    Args:
+        costs: Cost table level for the robot operating the numeric keypad
+
+    Returns
+    -------
+        `(11, 11)` array of minimum press counts indexed by numeric key ids
+    """
+    size = len(NUMERIC_INDEX)
+    numeric_costs = np.zeros((size, size), dtype=np.int64)
+
+    for a, b in product(range(size), repeat=2):
+        numeric_costs[a, b] = min(_keypad_cost(move, costs) for move in NUMERIC_MOVES[a][b])
+
+    return numeric_costs
+
+
+NUMERIC_MOVES = _encode_moves(_parse_moves(NUMERIC_KEYPAD), NUMERIC_INDEX)
+DIRECTIONAL_MOVES = _encode_moves(_parse_moves(DIRECTIONAL_KEYPAD), DIRECTIONAL_INDEX)
+NUMERIC_COSTS = np.stack([_build_numeric_costs(level) for level in _build_cost_table(MAX_DEPTH)])
 
-        Returns
-        -------
-            List of possible movement sequence combinations to input the code
-        """
-        code = "A" + code
-        moves = [self.moves2[(a, b)] if a != b else ["A"] for a, b in pairwise(code)]
-        return self.build_combinations(moves)
+
+class Solution(SolutionBase):
+    """Robot movement translation through keypad chains.
+
+    This solution implements robot translation algorithms:
+    - Part 1: Calculate movement complexity with 2-robot chains
+    - Part 2: Calculate movement complexity with 25-robot chains
+    """
 
     def translate(self, code: str, depth: int) -> int:
-        """Calculate minimum moves needed for a chain of robots to input a code.
+        """Calculate minimum moves needed for a chain of robots to input a numeric code.
 
         Args:
-            code: The input code to translate (either numeric or directional)
-            depth: Number of robots in the chain (2 for part 1, 25 for part 2)
+            code: The numeric code to translate
+            depth: Number of directional robots in the chain (at most `MAX_DEPTH`)
 
         Returns
         -------
             Minimum number of total moves required to input the code
         """
-        cache_key = (code, depth)
-        if cache_key in self.translation_cache:
-            return self.translation_cache[cache_key]
-
-        moves = self.translate_numpad(code) if code[0].isnumeric() else self.translate_keypad(code)
-
-        if depth == 0:
-            result = min(sum(len(move_part) for move_part in move) for move in moves)
-            self.translation_cache[cache_key] = result
-            return result
-
-        min_cost = float("inf")
-        for move in moves:
-            move_cost = sum(self.translate(curr_code, depth - 1) for curr_code in move)
-            min_cost = min(min_cost, move_cost)
-
-        result = int(min_cost)
-        self.translation_cache[cache_key] = result
-        return result
+        keys = [NUMERIC_INDEX[key] for key in "A" + code]
+        return int(NUMERIC_COSTS[depth, keys[:-1], keys[1:]].sum())
 
     def solve_part(self, data: list[str], depth: int) -> int:
         """Solve puzzle by calculating complexity for robot chains.
@@ -193,13 +252,6 @@ class Solution(SolutionBase):
         -------
             Total complexity score summed across all codes
         """
-        if not self.moves1:
-            self.moves1 = self.parse_moves(self.numeric_keypad)
-            self.moves2 = self.parse_moves(self.directional_keypad)
-
-            # Clear the translation cache
-            self.translation_cache.clear()
-
         total = 0
         for code in data:
             code = code.strip()
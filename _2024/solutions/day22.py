@@ -14,8 +14,8 @@ The module contains a Solution class that inherits from SolutionBase and
 implements methods to transform secret numbers and analyze price patterns.
 """
 
-from collections import defaultdict
-from itertools import pairwise
+import numpy as np
+import numpy.typing as npt
 
 from aoc.models.base import SolutionBase
 
@@ -32,32 +32,43 @@ class Solution(SolutionBase):
     """
 
     rounds: int = 2000
+    window_keys: int = 19**4
 
-    def transform_secret(self, secret: int) -> int:
-        """Transform a secret number through bitwise operations.
+    def transform_secrets(self, secrets: npt.NDArray[np.uint32]) -> npt.NDArray[np.uint32]:
+        """Transform every buyer's secret number through bitwise operations at once.
 
         Applies three sequential transformations using multiplication, division,
         XOR (mix), and modulo (prune) operations. Each step mixes a calculated
         value into the secret using XOR, then prunes the result using modulo
         16777216 to keep values in range.
 
+        Multiplying and dividing by powers of two are shifts and pruning is a mask
+        of the low 24 bits, so each step is a shift, XOR and AND applied to the
+        whole array in fixed-width `uint32` lanes. Bits shifted past the 32-bit
+        lane are discarded by the mask anyway. The array is updated in place.
+
         Args:
-            secret (int): The secret number to transform
+            secrets: Array of secret numbers, one per buyer
 
         Returns
         -------
-            Transformed secret number after applying all three steps
+            The same array after applying all three steps
         """
-        secret = ((secret * 64) ^ secret) % 16777216
-        secret = ((secret // 32) ^ secret) % 16777216
-        return ((secret * 2048) ^ secret) % 16777216
+        secrets ^= secrets << 6
+        secrets &= 0xFFFFFF
+        secrets ^= secrets >> 5
+        secrets &= 0xFFFFFF
+        secrets ^= secrets << 11
+        secrets &= 0xFFFFFF
+        return secrets
 
     def part1(self, data: list[str]) -> int:
         """Calculate sum of secret numbers after 2000 transformations.
 
         Processes each initial secret number through 2000 rounds of transformation,
         then sums all final secret values. This simulates the pseudorandom number
-        generation for each buyer over a full day.
+        generation for each buyer over a full day. All buyers advance together, so
+        the round loop runs once rather than once per buyer.
 
         Args:
             data (list[str]): List of strings containing initial secret numbers
@@ -66,14 +77,11 @@ class Solution(SolutionBase):
         -------
             Sum of all secret numbers after 2000 transformation rounds
         """
-        secrets = []
-        for secret in map(int, data):
-            for _ in range(self.rounds):
-                secret = self.transform_secret(secret)
-
-            secrets.append(secret)
+        secrets = np.array(list(map(int, data)), dtype=np.uint32)
+        for _ in range(self.rounds):
+            self.transform_secrets(secrets)
 
-        return sum(secrets)
+        return int(secrets.sum(dtype=np.int64))
 
     def part2(self, data: list[str]) -> int:
         """Find the price change sequence that maximizes total bananas.
@@ -83,6 +91,11 @@ class Solution(SolutionBase):
         consecutive price changes and identifies which sequence yields the
         highest total price across all buyers when they first encounter it.
 
+        Price generation and window accumulation are fused into a single pass per
+        buyer: the last four changes (each shifted into ``0..18``) are rolled into
+        one base-19 integer key that indexes flat ``totals`` and ``seen`` tables,
+        so no intermediate price or change lists are built.
+
         Args:
             data (list[str]): List of strings containing initial secret numbers
 
@@ -90,26 +103,22 @@ class Solution(SolutionBase):
         -------
             Maximum total bananas obtainable from any four-change sequence
         """
-        prices = []
-        for secret in map(int, data):
-            price = []
-            for _ in range(self.rounds):
-                secret = self.transform_secret(secret)
-                price.append(secret % 10)
-
-            prices.append(price)
-
-        changes = [[b - a for a, b in pairwise(p)] for p in prices]
-        amounts: defaultdict[tuple[int, ...], int] = defaultdict(int)
-
-        for buyer_idx, change in enumerate(changes):
-            keys = set()
-            for i in range(len(change) - 3):
-                key = tuple(change[i : i + 4])
-                if key in keys:
-                    continue
-
-                amounts[key] += prices[buyer_idx][i + 4]
-                keys.add(key)
-
-        return max(amounts.values())
+        totals = [0] * self.window_keys
+        seen = [-1] * self.window_keys
+
+        for buyer_idx, secret in enumerate(map(int, data)):
+            prev = secret % 10
+            key = 0
+            for i in range(self.rounds):
+                secret = ((secret << 6) ^ secret) & 0xFFFFFF
+                secret = ((secret >> 5) ^ secret) & 0xFFFFFF
+                secret = ((secret << 11) ^ secret) & 0xFFFFFF
+                price = secret % 10
+                key = (key * 19 + price - prev + 9) % self.window_keys
+                prev = price
+
+                if i >= 3 and seen[key] != buyer_idx:
+                    seen[key] = buyer_idx
+                    totals[key] += price
+
+        return max(totals)
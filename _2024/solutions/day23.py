@@ -15,8 +15,6 @@ The module contains a Solution class that inherits from SolutionBase and
 implements methods using rustworkx with custom clique detection.
 """
 
-from itertools import combinations
-
 import rustworkx as rx
 
 from aoc.models.base import SolutionBase
@@ -41,6 +39,9 @@ class Solution(SolutionBase):
         represent direct network connections between them. Each connection
         is bidirectional.
 
+        Node ids are assigned in one parsing pass, after which nodes and edges
+        are each added with a single batch call instead of one call per line.
+
         Args:
             data (list[str]): List of connection strings in format "id1-id2"
 
@@ -48,57 +49,218 @@ class Solution(SolutionBase):
         -------
             rustworkx PyGraph object representing the computer network
         """
+        node_map: dict[str, int] = {}
+        edges = [
+            (node_map.setdefault(source, len(node_map)), node_map.setdefault(target, len(node_map)))
+            for source, target in (line.split("-", 1) for line in data)
+        ]
+
         graph = rx.PyGraph()
-        node_map = {}
+        graph.add_nodes_from(list(node_map))
+        graph.add_edges_from_no_data(edges)
+        return graph
 
-        for line in data:
-            source, target = line.split("-")
+    def _bitmaps(self, graph: rx.PyGraph) -> tuple[list[str], list[int]]:
+        """Extract node labels and neighbour bitmaps from the graph.
 
-            if source not in node_map:
-                node_map[source] = graph.add_node(source)
-            if target not in node_map:
-                node_map[target] = graph.add_node(target)
+        Args:
+            graph: rustworkx PyGraph to convert
 
-            graph.add_edge(node_map[source], node_map[target], None)
+        Returns
+        -------
+            Tuple of node labels and neighbour bitmaps, both indexed by node
+        """
+        labels = list(graph.nodes())
+        neighbors = [0] * len(graph)
+        for source, target in graph.edge_list():
+            neighbors[source] |= 1 << target
+            neighbors[target] |= 1 << source
 
-        return graph
+        return labels, neighbors
 
-    def _bron_kerbosch_recursive(
-        self, graph: rx.PyGraph, r: set[int], p: set[int], x: set[int], cliques: list[list[str]]
-    ) -> None:
-        """Recursive helper for Bron-Kerbosch algorithm.
+    def _choose_pivot(self, neighbors: list[int], p: int, x: int) -> int:
+        """Pick the Tomita pivot: the node in `p | x` with the most neighbours in `p`.
 
         Args:
-            graph: rustworkx PyGraph to search
-            r: Current clique being built
-            p: Candidate nodes to extend clique
-            x: Already processed nodes
-            cliques: List to accumulate found cliques
+            neighbors: Precomputed neighbour bitmaps, indexed by node
+            p: Bitmap of candidate nodes
+            x: Bitmap of already processed nodes
+
+        Returns
+        -------
+            Index of the pivot node
         """
-        if not p and not x:
-            cliques.append([graph[node] for node in r])
-            return
+        pivot, best = 0, -1
+        remaining = p | x
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            u = bit.bit_length() - 1
+            if (count := (p & neighbors[u]).bit_count()) > best:
+                pivot, best = u, count
+
+        return pivot
 
-        for v in list(p):
-            neighbors = set(graph.neighbors(v))
-            self._bron_kerbosch_recursive(graph, r | {v}, p & neighbors, x & neighbors, cliques)
-            p.remove(v)
-            x.add(v)
+    def _degeneracy_order(self, neighbors: list[int]) -> list[int]:
+        """Order nodes by repeatedly removing a node of minimum remaining degree.
 
-    def find_cliques(self, graph: rx.PyGraph) -> list[list[str]]:
-        """Find all maximal cliques using Bron-Kerbosch algorithm.
+        Uses bucket-based peeling: nodes are kept in buckets indexed by their
+        current degree, and removing a node moves each remaining neighbour down one
+        bucket. Stale bucket entries are skipped when popped.
+
+        Args:
+            neighbors: Precomputed neighbour bitmaps, indexed by node
+
+        Returns
+        -------
+            Node indices in degeneracy order
+        """
+        degree = [mask.bit_count() for mask in neighbors]
+        buckets: list[list[int]] = [[] for _ in range(max(degree, default=0) + 1)]
+        for node, deg in enumerate(degree):
+            buckets[deg].append(node)
+
+        removed = [False] * len(neighbors)
+        order: list[int] = []
+        lowest = 0
+
+        while len(order) < len(neighbors):
+            while not buckets[lowest]:
+                lowest += 1
+
+            node = buckets[lowest].pop()
+            if removed[node] or degree[node] != lowest:
+                continue
+
+            removed[node] = True
+            order.append(node)
+
+            remaining = neighbors[node]
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                u = bit.bit_length() - 1
+                if not removed[u]:
+                    degree[u] -= 1
+                    buckets[degree[u]].append(u)
+
+            lowest = max(lowest - 1, 0)
+
+        return order
+
+    def _decode(self, labels: list[str], r: int) -> list[str]:
+        """Convert a clique bitmap back into node labels.
+
+        Args:
+            labels: Node labels, indexed by node
+            r: Bitmap of clique members
+
+        Returns
+        -------
+            Labels of the clique members
+        """
+        clique = []
+        while r:
+            bit = r & -r
+            clique.append(labels[bit.bit_length() - 1])
+            r ^= bit
+
+        return clique
+
+    def _branch_and_bound(self, neighbors: list[int], r: int, p: int, best: list[int]) -> None:
+        """Grow `r` into the largest clique it can reach, pruning hopeless branches.
+
+        Runs a pivoted Bron-Kerbosch style search without an excluded set, since
+        only the size of a clique matters here, not its maximality. Vertex sets
+        are bitmaps stored in Python ints, and an explicit stack replaces
+        recursion. A branch is dropped as soon as `|r| + |p|` cannot beat the
+        best clique found so far. Each frame carries `|r|` alongside the
+        bitmaps, so the bound costs a single `int.bit_count` on `p`.
+
+        Args:
+            neighbors: Precomputed neighbour bitmaps, indexed by node
+            r: Bitmap of the clique to extend
+            p: Bitmap of candidate nodes to extend clique
+            best: Two-element list holding the size and bitmap of the largest
+                clique found so far, updated in place
+        """
+        stack = [(r, r.bit_count(), p, p & ~neighbors[self._choose_pivot(neighbors, p, 0)])]
+
+        while stack:
+            r, size, p, candidates = stack[-1]
+            if not candidates or size + p.bit_count() <= best[0]:
+                stack.pop()
+                continue
+
+            bit = candidates & -candidates
+            stack[-1] = (r, size, p ^ bit, candidates ^ bit)
+
+            v = bit.bit_length() - 1
+            new_p = p & neighbors[v]
+
+            if not new_p:
+                if size + 1 > best[0]:
+                    best[:] = [size + 1, r | bit]
+
+            elif size + 1 + new_p.bit_count() > best[0]:
+                pivot = self._choose_pivot(neighbors, new_p, 0)
+                stack.append((r | bit, size + 1, new_p, new_p & ~neighbors[pivot]))
+
+    def _greedy_clique(self, neighbors: list[int], node: int) -> int:
+        """Grow a clique from `node` by always adding the best-connected candidate.
+
+        Args:
+            neighbors: Precomputed neighbour bitmaps, indexed by node
+            node: Index of the starting node
+
+        Returns
+        -------
+            Bitmap of a (not necessarily maximum) clique containing `node`
+        """
+        r, p = 1 << node, neighbors[node]
+        while p:
+            v = self._choose_pivot(neighbors, p, 0)
+            r |= 1 << v
+            p &= neighbors[v]
+
+        return r
+
+    def max_clique(self, graph: rx.PyGraph) -> list[str]:
+        """Find a maximum clique using branch-and-bound.
+
+        The outer loop visits nodes in degeneracy order, and each node only
+        searches its later neighbours, so every branch is bounded by the graph's
+        degeneracy. Any node whose later neighbourhood is too small to beat the
+        best clique so far is skipped. The bound starts from a greedy clique
+        rather than zero.
 
         Args:
             graph: rustworkx PyGraph to search
 
         Returns
         -------
-            List of maximal cliques, where each clique is a list of node labels
+            Node labels of a largest clique in the graph
         """
-        cliques: list[list[str]] = []
-        all_nodes = set(graph.node_indices())
-        self._bron_kerbosch_recursive(graph, set(), all_nodes, set(), cliques)
-        return cliques
+        labels, neighbors = self._bitmaps(graph)
+        order = self._degeneracy_order(neighbors)
+        if not order:
+            return []
+
+        # Seed the bound with a greedy clique from the innermost core, which
+        # lets most outer iterations be skipped before any search starts.
+        seed = self._greedy_clique(neighbors, order[-1])
+        best = [seed.bit_count(), seed]
+
+        later = (1 << len(graph)) - 1
+        for node in order:
+            bit = 1 << node
+            later ^= bit
+            p = later & neighbors[node]
+
+            if 1 + p.bit_count() > best[0]:
+                self._branch_and_bound(neighbors, bit, p, best)
+
+        return self._decode(labels, best[1])
 
     def part1(self, data: list[str]) -> int:
         """Count sets of three interconnected computers including the Chief Historian.
@@ -107,6 +269,12 @@ class Solution(SolutionBase):
         connected to the other two) and include at least one computer whose name
         starts with 't' (indicating the Chief Historian's potential location).
 
+        A trio is just a triangle, so triangles are enumerated directly on the
+        neighbour bitmaps: for each edge `(u, v)` with `u < v`, the common
+        neighbours above `v` each close exactly one triangle, and the ordering
+        counts each triangle once. When neither `u` nor `v` starts with 't',
+        only common neighbours in the 't' bitmap are counted.
+
         Args:
             data (list[str]): List of connection strings representing the network
 
@@ -114,21 +282,29 @@ class Solution(SolutionBase):
         -------
             Number of unique trios containing at least one computer starting with 't'
         """
-        graph = self.construct_graph(data)
-        teacher_cliques = [
-            clique
-            for clique in self.find_cliques(graph)
-            if len(clique) >= 3 and any(node.startswith("t") for node in clique)
-        ]
-
-        return len(
-            {
-                tuple(sorted(nodes))
-                for clique in teacher_cliques
-                for nodes in combinations(clique, 3)
-                if any(node.startswith("t") for node in nodes)
-            }
-        )
+        labels, neighbors = self._bitmaps(self.construct_graph(data))
+        t_nodes = 0
+        for node, label in enumerate(labels):
+            if label[0] == "t":
+                t_nodes |= 1 << node
+
+        count = 0
+        for u, u_neighbors in enumerate(neighbors):
+            u_has_t = t_nodes >> u & 1
+            later = u_neighbors >> (u + 1) << (u + 1)
+
+            while later:
+                bit = later & -later
+                later ^= bit
+                v = bit.bit_length() - 1
+
+                common = u_neighbors & neighbors[v] & -(bit << 1)
+                if u_has_t or t_nodes & bit:
+                    count += common.bit_count()
+                else:
+                    count += (common & t_nodes).bit_count()
+
+        return count
 
     def part2(self, data: list[str]) -> str:
         """Find the password by identifying the largest LAN party group.
@@ -137,6 +313,9 @@ class Solution(SolutionBase):
         set of computers where every computer is directly connected to every other
         computer. Returns the sorted computer names as a comma-separated password.
 
+        Uses the branch-and-bound `max_clique` search rather than enumerating every
+        maximal clique.
+
         Args:
             data (list[str]): List of connection strings representing the network
 
@@ -145,5 +324,4 @@ class Solution(SolutionBase):
             Password string of alphabetically sorted computer IDs joined by commas
         """
         graph = self.construct_graph(data)
-        largest_clique = max(self.find_cliques(graph), key=len)
-        return ",".join(sorted(largest_clique))
+        return ",".join(sorted(self.max_clique(graph)))
@@ -10,118 +10,108 @@ The solution involves simulating the circuit to determine output values and
 analyzing the circuit structure to identify misconnected wires that need to be
 swapped to fix the adder implementation.
 
-The module contains Connection and Circuit dataclasses for representing the
-circuit structure, a CircuitValidator for verifying correct adder wiring, and
-a Solution class that inherits from SolutionBase.
+The module contains a Connection named tuple and a Circuit dataclass for
+representing the circuit structure, a CircuitValidator for verifying correct
+adder wiring, and a Solution class that inherits from SolutionBase.
 """
 
-from collections.abc import Callable
+from collections import deque
 from dataclasses import dataclass, field
-import re
+from functools import lru_cache
+from typing import NamedTuple
 
 from aoc.models.base import SolutionBase
 
 
-@dataclass
-class Connection:
+class Connection(NamedTuple):
     """Represents a logic gate connection in the circuit.
 
+    Wires are referred to by their interned integer ids (see `Circuit.names`).
+
     Attributes
     ----------
-        input1 (str): First input wire identifier
+        input1 (int): First input wire id
         gate (str): Gate operation type (AND, OR, XOR)
-        input2 (str): Second input wire identifier
-        output (str): Output wire identifier
+        input2 (int): Second input wire id
+        output (int): Output wire id
     """
 
-    input1: str
+    input1: int
     gate: str
-    input2: str
-    output: str
-
-    def __str__(self) -> str:
-        """Generate string representation of the connection.
-
-        Returns
-        -------
-            String in format 'input1 gate input2 -> output'
-        """
-        return f"{self.input1} {self.gate} {self.input2} -> {self.output}"
+    input2: int
+    output: int
 
 
 @dataclass
 class Circuit:
     """Represents a digital circuit with wires and logic gate connections.
 
+    Wire names are interned to consecutive integer ids so that wire values and
+    gate bookkeeping live in plain lists rather than string-keyed dicts.
+
     Attributes
     ----------
-        wires (dict[str, int]): Maps wire identifiers to their values (-1 for unknown)
+        names (list[str]): Wire identifier for each wire id
+        wires (list[int]): Value of each wire by id (-1 for unknown)
         connections (list[Connection]): Logic gate connections in the circuit
-        operators (dict[str, Callable]): Maps gate types to their logic functions
+        z_wires (list[int]): Ids of the gate-driven z-wires, least significant bit first
     """
 
-    wires: dict[str, int]
+    names: list[str]
+    wires: list[int]
     connections: list[Connection] = field(default_factory=list)
-    operators: dict[str, Callable[[int, int], int]] = field(
-        default_factory=lambda: {
-            "OR": lambda x, y: x | y,
-            "AND": lambda x, y: x & y,
-            "XOR": lambda x, y: x ^ y,
-        }
-    )
+    z_wires: list[int] = field(default_factory=list)
 
-    def calc(self, wire: str) -> int:
-        """Calculate the value of a wire recursively based on its inputs.
+    def execute(self) -> int:
+        """Execute the circuit and return the number encoded on the z-wires.
 
-        Recursively evaluates the circuit by finding the gate that outputs to
-        this wire and computing its inputs first.
-
-        Args:
-            wire (str): Identifier of the wire to calculate
+        Evaluates the gates in topological order (Kahn's algorithm): each gate
+        counts its unknown inputs and fires once that count drops to zero, so
+        every gate is visited exactly once without recursing along carry chains.
+        The z-wire bits are then packed straight into an integer.
 
         Returns
         -------
-            Computed value for the wire (0 or 1)
+            Decimal value represented by the binary output on z-wires
 
         Raises
         ------
-            ValueError: If no connection is found for the wire
+            ValueError: If a z-wire cannot be resolved from the initial values
         """
-        if self.wires[wire] != -1:
-            return self.wires[wire]
+        wires = self.wires
+        children: list[list[Connection]] = [[] for _ in wires]
+        pending_inputs = [0] * len(wires)
 
         for conn in self.connections:
-            if conn.output == wire:
-                x = self.calc(conn.input1)
-                y = self.calc(conn.input2)
-                self.wires[wire] = self.operators[conn.gate](x, y)
-                return self.wires[wire]
+            for wire in (conn.input1, conn.input2):
+                if wires[wire] == -1:
+                    children[wire].append(conn)
+                    pending_inputs[conn.output] += 1
 
-        err_msg = f"No connection found for wire {wire}"
-        raise ValueError(err_msg)
+        queue = deque(conn for conn in self.connections if pending_inputs[conn.output] == 0)
+        while queue:
+            input1, gate, input2, output = queue.popleft()
+            if gate == "AND":
+                wires[output] = wires[input1] & wires[input2]
+            elif gate == "OR":
+                wires[output] = wires[input1] | wires[input2]
+            else:
+                wires[output] = wires[input1] ^ wires[input2]
 
-    def execute(self) -> list[int]:
-        """Execute the circuit and return the z-wire values.
+            for child in children[output]:
+                pending_inputs[child.output] -= 1
+                if pending_inputs[child.output] == 0:
+                    queue.append(child)
 
-        Computes all output wires (those starting with 'z') and returns their
-        values in order from most significant to least significant bit.
+        z = 0
+        for i, wire in enumerate(self.z_wires):
+            if wires[wire] == -1:
+                err_msg = f"No value could be computed for wire {self.names[wire]}"
+                raise ValueError(err_msg)
 
-        Returns
-        -------
-            List of z-wire values in reverse order (MSB first)
-        """
-        z_values = []
-        i = 0
-
-        while True:
-            key = f"z{i:02}"
-            if key not in self.wires or all(conn.output != key for conn in self.connections):
-                break
-
-            z_values.append(self.calc(key))
-            i += 1
+            z |= wires[wire] << i
 
-        return z_values[::-1]  # Reverse for correct order (MSB first)
+        return z
 
 
 class CircuitValidator:
@@ -135,10 +125,31 @@ class CircuitValidator:
     def __init__(self, formulas: dict[str, tuple[str, str, str]]):
         """Initialize the validator with circuit formulas.
 
+        Each ``validate_*`` check is exposed through a per-instance
+        ``lru_cache`` keyed by ``(wire, num)``, so the carry chain shared by
+        consecutive bits is only walked once per `progress` call. Call
+        `clear_cache` whenever ``formulas`` is modified.
+
         Args:
             formulas (dict): Maps output wires to (operation, input1, input2) tuples
         """
         self.formulas = formulas
+        self.validate_z = lru_cache(maxsize=None)(self._validate_z)
+        self.validate_intermediate_xor = lru_cache(maxsize=None)(self._validate_intermediate_xor)
+        self.validate_carry_bit = lru_cache(maxsize=None)(self._validate_carry_bit)
+        self.validate_direct_carry = lru_cache(maxsize=None)(self._validate_direct_carry)
+        self.validate_recarry = lru_cache(maxsize=None)(self._validate_recarry)
+
+    def clear_cache(self) -> None:
+        """Discard memoized validation results after the formulas change."""
+        for validator in (
+            self.validate_z,
+            self.validate_intermediate_xor,
+            self.validate_carry_bit,
+            self.validate_direct_carry,
+            self.validate_recarry,
+        ):
+            validator.cache_clear()
 
     def make_wire(self, char: str, num: int) -> str:
         """Create a wire identifier with the given character and number.
@@ -153,7 +164,7 @@ class CircuitValidator:
         """
         return f"{char}{num:02}"
 
-    def validate_z(self, wire: str, num: int) -> bool:
+    def _validate_z(self, wire: str, num: int) -> bool:
         """Validate that a z-wire correctly implements the sum bit.
 
         Args:
@@ -181,7 +192,7 @@ class CircuitValidator:
             and self.validate_carry_bit(x, num)
         )
 
-    def validate_intermediate_xor(self, wire: str, num: int) -> bool:
+    def _validate_intermediate_xor(self, wire: str, num: int) -> bool:
         """Validate an intermediate XOR gate that combines input bits.
 
         Args:
@@ -201,7 +212,7 @@ class CircuitValidator:
 
         return sorted([x, y]) == [self.make_wire("x", num), self.make_wire("y", num)]
 
-    def validate_carry_bit(self, wire: str, num: int) -> bool:
+    def _validate_carry_bit(self, wire: str, num: int) -> bool:
         """Validate that a wire correctly implements the carry bit logic.
 
         Args:
@@ -232,7 +243,7 @@ class CircuitValidator:
             and self.validate_recarry(x, num - 1)
         )
 
-    def validate_direct_carry(self, wire: str, num: int) -> bool:
+    def _validate_direct_carry(self, wire: str, num: int) -> bool:
         """Validate a direct carry gate (AND of input bits).
 
         Args:
@@ -252,7 +263,7 @@ class CircuitValidator:
 
         return sorted([x, y]) == [self.make_wire("x", num), self.make_wire("y", num)]
 
-    def validate_recarry(self, wire: str, num: int) -> bool:
+    def _validate_recarry(self, wire: str, num: int) -> bool:
         """Validate a recarry gate (propagated carry from previous bit).
 
         Args:
@@ -302,6 +313,30 @@ class CircuitValidator:
 
         return i
 
+    def cone(self, wire: str) -> set[str]:
+        """Collect the gate outputs that feed into a wire.
+
+        Args:
+            wire (str): Wire identifier to start from
+
+        Returns
+        -------
+            Set of gate output wires reachable from `wire` through gate inputs,
+            including `wire` itself when it is a gate output
+        """
+        seen: set[str] = set()
+        stack = [wire]
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in self.formulas:
+                continue
+
+            seen.add(current)
+            _, x, y = self.formulas[current]
+            stack += [x, y]
+
+        return seen
+
 
 class Solution(SolutionBase):
     """Simulate and debug digital circuits implementing binary addition.
@@ -328,31 +363,37 @@ class Solution(SolutionBase):
             Circuit object with initialized wires and connections
         """
         separator_idx = data.index("")
-        wires = {}
+        wire_ids: dict[str, int] = {}
+        wires: list[int] = []
+
+        def intern(wire: str) -> int:
+            if wire not in wire_ids:
+                wire_ids[wire] = len(wires)
+                wires.append(-1)
+
+            return wire_ids[wire]
 
         for line in data[:separator_idx]:
             wire, val = line.split(": ")
-            wires[wire] = int(val)
+            wires[intern(wire)] = int(val)
 
         connections = []
         for line in data[separator_idx + 1 :]:
-            match = re.match(r"(\w+) (OR|AND|XOR) (\w+) -> (\w+)", line)
-            if match:
-                input1, gate, input2, output = match.groups()
-
-                for wire in [input1, input2, output]:
-                    if wire not in wires:
-                        wires[wire] = -1
+            input1, gate, input2, _, output = line.split()
+            connections.append(Connection(intern(input1), gate, intern(input2), intern(output)))
 
-                connections.append(Connection(input1, gate, input2, output))
+        outputs = {conn.output for conn in connections}
+        z_wires: list[int] = []
+        while (z_wire := wire_ids.get(f"z{len(z_wires):02}", -1)) in outputs:
+            z_wires.append(z_wire)
 
-        return Circuit(wires, connections)
+        return Circuit(list(wire_ids), wires, connections, z_wires)
 
     def part1(self, data: list[str]) -> int:
         """Simulate the circuit and compute the decimal output value.
 
         Executes all gates in the circuit to determine the final values of all
-        z-wires, then converts the binary representation to decimal.
+        z-wires and reads them as a binary number.
 
         Args:
             data (list[str]): Input lines with wire values and gate definitions
@@ -362,15 +403,15 @@ class Solution(SolutionBase):
             Decimal value represented by the binary output on z-wires
         """
         circuit = self.parse_data(data)
-        z_values = circuit.execute()
-        return int("".join(map(str, z_values)), 2)
+        return circuit.execute()
 
     def part2(self, data: list[str]) -> str:
         """Identify swapped output wires by validating adder structure.
 
         Analyzes the circuit to find pairs of gates with swapped outputs that
         prevent the circuit from correctly implementing a binary adder. Uses
-        iterative validation and swapping to identify all four pairs.
+        iterative validation and swapping to identify all four pairs, only
+        trying swaps that involve a gate first reached by the failing bit.
 
         Args:
             data (list[str]): Input lines with gate definitions
@@ -378,32 +419,47 @@ class Solution(SolutionBase):
         Returns
         -------
             Comma-separated string of sorted wire identifiers that are swapped
+
+        Raises
+        ------
+            ValueError: If no single swap makes the failing bit valid
         """
         formulas = {}
         separator_idx = data.index("")
 
         for line in data[separator_idx + 1 :]:
-            match = re.match(r"(\w+) (OR|AND|XOR) (\w+) -> (\w+)", line)
-            if match:
-                input1, gate, input2, output = match.groups()
-                formulas[output] = (gate, input1, input2)
+            input1, gate, input2, _, output = line.split()
+            formulas[output] = (gate, input1, input2)
 
         validator = CircuitValidator(formulas)
         swaps = []
 
         for _ in range(4):
             baseline = validator.progress()
-            for x in formulas:
-                for y in formulas:
+
+            # Every gate under the last valid z-wire has been checked, so one of
+            # the swapped outputs must be among the gates new to the failing bit.
+            verified = validator.cone(validator.make_wire("z", baseline - 1)) if baseline else set()
+            frontier = validator.cone(validator.make_wire("z", baseline)) - verified
+            candidates = [wire for wire in formulas if wire not in verified]
+
+            for x in [wire for wire in candidates if wire in frontier]:
+                for y in candidates:
                     if x == y:
                         continue
                     formulas[x], formulas[y] = formulas[y], formulas[x]
+                    validator.clear_cache()
                     if validator.progress() > baseline:
                         break
                     formulas[x], formulas[y] = formulas[y], formulas[x]
+                    validator.clear_cache()
                 else:
                     continue
                 break
+            else:
+                err_msg = f"No swap fixes bit {baseline}"
+                raise ValueError(err_msg)
+
             swaps += [x, y]
 
         return ",".join(sorted(swaps))
@@ -3,6 +3,7 @@
 This module contains tests for the Day 14 solution, which simulates robots
 moving in a confined grid space. The tests verify:
 1. Part 1: Calculating product of robots in each quadrant after 100 time steps
+2. Part 2: Finding the time step at which the robots cluster together
 """
 
 from aoc.models.tester import TestSolutionUtility
@@ -23,3 +24,20 @@ def test_day14_part1() -> None:
         part_num=1,
         expected=12,
     )
+
+
+def test_day14_part2() -> None:
+    """Test finding the time step at which the robots cluster together.
+
+    Uses a synthetic set of twelve robots that all sit within one cell of the
+    grid centre at step 52 and are more spread out at every other step. Since 52 is
+    8 modulo the width and 3 modulo the height, the per-axis offsets only give
+    the right answer once they are combined with the Chinese remainder theorem.
+    """
+    TestSolutionUtility.run_test(
+        year=2024,
+        day=14,
+        is_raw=False,
+        part_num=2,
+        expected=52,
+    )
@@ -3,6 +3,7 @@
 This module contains tests for the Day 24 solution, which analyzes digital circuits
 and identifies wire connections. The tests verify:
 1. Part 1: Executing a digital circuit to determine the output value
+2. Part 2: Identifying the swapped gate outputs in a ripple-carry adder
 """
 
 from aoc.models.tester import TestSolutionUtility
@@ -23,3 +24,21 @@ def test_day24_part1() -> None:
         part_num=1,
         expected=4,
     )
+
+
+def test_day24_part2() -> None:
+    """Test identifying the swapped gate outputs of an adder.
+
+    Uses a synthetic 8-bit ripple-carry adder with four pairs of swapped gate
+    outputs. One pair breaks bit 0, so the search starts with nothing verified,
+    and another swaps `z05` with a gate of bit 6, so that partner lies outside
+    the failing bit's frontier. Verifies that the restricted search still finds
+    all four pairs.
+    """
+    TestSolutionUtility.run_test(
+        year=2024,
+        day=24,
+        is_raw=False,
+        part_num=2,
+        expected="dt9,es0,kjz,suv,wt2,z00,z05,z07",
+    )
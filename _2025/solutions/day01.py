@@ -9,9 +9,11 @@ The module contains a Solution class that inherits from SolutionBase for
 parsing dial movements and tracking zero position counts.
 """
 
-import re
 from typing import ClassVar
 
+import numpy as np
+import numpy.typing as npt
+
 from aoc.models.base import SolutionBase
 
 
@@ -23,12 +25,12 @@ class Solution(SolutionBase):
     a number of steps. Part 1 counts endings at position 0. Part 2 counts every
     pass through position 0 during rotations.
 
-    Uses modular arithmetic for efficient dial position tracking.
+    Moves are parsed into signed deltas once and both parts are evaluated with
+    vectorised NumPy arithmetic over the unwrapped dial positions.
     """
 
     DIAL_SIZE: ClassVar[int] = 100
     START_POSITION: ClassVar[int] = 50
-    MOVE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"(L|R)(\d+)$")
 
     def parse_move(self, move: str) -> tuple[str, int]:
         """Parse movement instruction into direction and step count.
@@ -44,64 +46,49 @@ class Solution(SolutionBase):
         ------
             ValueError: If instruction format is invalid
         """
-        match = self.MOVE_PATTERN.match(move)
-        if not match:
+        direction, steps = move[:1], move[1:]
+        if direction not in ("L", "R") or not steps.isdigit():
             err_msg = f"Invalid move: {move}"
             raise ValueError(err_msg)
 
-        return match.group(1), int(match.group(2))
+        return direction, int(steps)
 
-    def move_jump(self, position: int, direction: str, steps: int) -> tuple[int, int]:
-        """Move dial by steps using modular arithmetic, count final zero landings.
+    def parse_moves(self, data: list[str]) -> npt.NDArray[np.int64]:
+        """Parse all instructions into signed rotation deltas.
 
         Args:
-            position: Current dial position (0-99)
-            direction: "L" (counterclockwise) or "R" (clockwise)
-            steps: Number of positions to rotate
+            data: List of rotation instructions (e.g., ["R48", "L68"])
 
         Returns
         -------
-            tuple[int, int]: (new_position, zero_count) where zero_count is 1 if
-                final position is 0, else 0
+            npt.NDArray[np.int64]: Per-move delta, negative for "L" and positive for "R"
         """
-        if direction == "L":
-            new_position = (position - steps) % self.DIAL_SIZE
-        else:
-            new_position = (position + steps) % self.DIAL_SIZE
-
-        zero_count = 1 if new_position == 0 else 0
-
-        return new_position, zero_count
+        deltas = [
+            -steps if direction == "L" else steps for direction, steps in map(self.parse_move, data)
+        ]
+        return np.array(deltas, dtype=np.int64)
 
-    def move_step(self, position: int, direction: str, steps: int) -> tuple[int, int]:
-        """Move dial one position at a time, counting every pass through zero.
+    def unwrapped_positions(
+        self, deltas: npt.NDArray[np.int64]
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Compute unwrapped dial positions before and after every move.
 
         Args:
-            position: Current dial position (0-99)
-            direction: "L" (counterclockwise) or "R" (clockwise)
-            steps: Number of positions to rotate
+            deltas: Signed rotation deltas from `parse_moves`
 
         Returns
         -------
-            tuple[int, int]: (final_position, total_zero_count) where total_zero_count
-                includes every time position 0 is passed during rotation
+            tuple: (before, after) arrays of positions on the unwrapped number line
         """
-        zero_count = 0
-        step_direction = -1 if direction == "L" else 1
-
-        for _ in range(steps):
-            position = (position + step_direction) % self.DIAL_SIZE
-            if position == 0:
-                zero_count += 1
-
-        return position, zero_count
+        after = self.START_POSITION + np.cumsum(deltas)
+        before = np.concatenate(([self.START_POSITION], after[:-1]))
+        return before, after
 
     def part1(self, data: list[str]) -> int:
         """Count dial rotations that end exactly at position 0.
 
         Starting at position 50, processes all rotation instructions and counts
         how many times the dial ends precisely at position 0 after each move.
-        Uses efficient modular arithmetic for large rotations.
 
         Args:
             data: List of rotation instructions (e.g., ["R48", "L68"])
@@ -110,15 +97,10 @@ class Solution(SolutionBase):
         -------
             int: Total number of rotations ending at position 0
         """
-        position = self.START_POSITION
-        zero_count = 1 if position == 0 else 0
+        _, after = self.unwrapped_positions(self.parse_moves(data))
+        zero_count = int(np.count_nonzero(after % self.DIAL_SIZE == 0))
 
-        for move in data:
-            direction, steps = self.parse_move(move)
-            position, zeros = self.move_jump(position, direction, steps)
-            zero_count += zeros
-
-        return zero_count
+        return zero_count + (1 if self.START_POSITION == 0 else 0)
 
     def part2(self, data: list[str]) -> int:
         """Count every time dial passes through position 0 during rotations.
@@ -127,6 +109,10 @@ class Solution(SolutionBase):
         positions. A full rotation (100 steps) in either direction passes through
         0 exactly once.
 
+        On the unwrapped number line a move visits ``before ± 1, ..., after``, so
+        its zero passes are the multiples of the dial size in that range, counted
+        for every move at once with floor division.
+
         Args:
             data: List of rotation instructions (e.g., ["R48", "L68"])
 
@@ -134,12 +120,11 @@ class Solution(SolutionBase):
         -------
             int: Total number of times position 0 is visited during all rotations
         """
-        position = self.START_POSITION
-        zero_count = 0
+        deltas = self.parse_moves(data)
+        before, after = self.unwrapped_positions(deltas)
+        size = self.DIAL_SIZE
 
-        for move in data:
-            direction, steps = self.parse_move(move)
-            position, zeros = self.move_step(position, direction, steps)
-            zero_count += zeros
+        right = after // size - before // size
+        left = (before - 1) // size - (after - 1) // size
 
-        return zero_count
+        return int(np.where(deltas > 0, right, left).sum())
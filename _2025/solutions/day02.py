@@ -9,8 +9,8 @@ The module contains a Solution class that inherits from SolutionBase for
 parsing ID ranges and summing the invalid IDs found.
 """
 
-from collections.abc import Callable
-from functools import partial
+from bisect import bisect_right
+from typing import ClassVar
 
 from aoc.models.base import SolutionBase
 
@@ -19,56 +19,85 @@ class Solution(SolutionBase):
     """Find and sum invalid product IDs based on repeating digit patterns.
 
     This solution processes a string of comma-separated ID ranges (e.g., "1-10,20-30").
-    It checks each ID in every range to see if it matches a specific pattern of
-    repeating digits.
+    Rather than checking each ID in every range, it generates the IDs that match
+    a specific pattern of repeating digits directly.
 
     Part 1 defines an invalid ID as one made of a digit sequence repeated twice (e.g., 1212).
     Part 2 expands this to any ID made of a sequence repeated at least twice (e.g., 1212, 121212).
     """
 
-    def has_repeated_sequence(self, n: int, num_repeats: int | None = None) -> bool:
-        """Check if a number consists of a repeating sequence of digits.
+    POWERS_OF_TEN: ClassVar[list[int]] = [10**i for i in range(1, 40)]
+
+    # For a `length`-digit number made of `k` copies of a `length // k`-digit
+    # block, the number equals the block times `(10**length - 1) // (10**size - 1)`
+    # (e.g. `1212 = 12 * 101`), so divisibility by that multiplier is the test.
+    REPEAT_MULTIPLIERS: ClassVar[dict[tuple[int, int], int]] = {
+        (length, k): (10**length - 1) // (10 ** (length // k) - 1)
+        for length in range(1, 41)
+        for k in range(2, length + 1)
+        if length % k == 0
+    }
+
+    # Any repetition count is a multiple of a prime one (six copies of `ab` are
+    # also two copies of `ababab`), so the general check only needs prime `k`.
+    PRIME_MULTIPLIERS: ClassVar[dict[int, tuple[int, ...]]] = {
+        length: tuple(
+            (10**length - 1) // (10 ** (length // k) - 1)
+            for k in range(2, length + 1)
+            if length % k == 0 and all(k % d for d in range(2, k))
+        )
+        for length in range(1, 41)
+    }
+
+    def invalid_ids(self, start: int, end: int, num_repeats: int | None = None) -> set[int]:
+        """Generate the invalid IDs of one inclusive range without scanning it.
+
+        Within a fixed digit count, the IDs made of `k` repeated blocks are
+        exactly the multiples of the matching repeat multiplier, so each
+        (length, multiplier) pair contributes an arithmetic progression that is
+        stepped through directly. Prime repetition counts cover the open-ended
+        case, with the set removing IDs reached through more than one count.
 
         Args:
-            n: The integer to check.
-            num_repeats: If an integer, checks for exactly that many repetitions.
-                         If None, checks for any number of repetitions (>= 2).
+            start: First ID of the range.
+            end: Last ID of the range.
+            num_repeats: If an integer, only IDs with exactly that many repetitions.
+                         If None, IDs with any number of repetitions (>= 2).
 
         Returns
         -------
-            bool: True if the number is formed by a repeating sequence, False otherwise.
+            set[int]: All invalid IDs in the range.
         """
-        s = str(n)
-        length = len(s)
+        ids: set[int] = set()
+        first_length = bisect_right(self.POWERS_OF_TEN, start) + 1
+        last_length = bisect_right(self.POWERS_OF_TEN, end) + 1
 
-        if num_repeats:
-            if num_repeats <= 1:
-                return False
+        for length in range(first_length, last_length + 1):
+            lo = max(start, 10 ** (length - 1))
+            hi = min(end, 10**length - 1)
 
-            if length % num_repeats != 0:
-                return False
+            if not num_repeats:
+                multipliers = self.PRIME_MULTIPLIERS[length]
+            elif num_repeats > 1 and length % num_repeats == 0:
+                multipliers = (self.REPEAT_MULTIPLIERS[length, num_repeats],)
+            else:
+                continue
 
-            size = length // num_repeats
-            return s == s[:size] * num_repeats
+            for multiplier in multipliers:
+                ids.update(range(-(-lo // multiplier) * multiplier, hi + 1, multiplier))
 
-        # Check for any number of repetitions from 2 up to the length of the string
-        for k in range(2, length + 1):
-            if length % k == 0:
-                size = length // k
-                if s == s[:size] * k:
-                    return True
+        return ids
 
-        return False
+    def solve_part(self, data: list[str], num_repeats: int | None = None) -> int:
+        """Find and sum invalid IDs within the input ranges.
 
-    def solve_part(self, data: list[str], func: Callable[[int], bool]) -> int:
-        """Find and sum invalid IDs based on a check function.
-
-        Parses the input string of ranges, iterates through each number, and applies
-        the provided checking function to identify and sum invalid IDs.
+        Parses the input string of ranges and sums the IDs produced by
+        `invalid_ids` for each range, so the cost depends on the number of
+        invalid IDs rather than on the width of the ranges.
 
         Args:
             data: A list containing one string of comma-separated ranges.
-            func: A callable that takes an integer and returns True if it's invalid.
+            num_repeats: Repetition count passed on to `invalid_ids`.
 
         Returns
         -------
@@ -77,9 +106,7 @@ class Solution(SolutionBase):
         invalid_sum = 0
         for line in data[0].split(","):
             start, end = map(int, line.split("-"))
-            for product_id in range(start, end + 1):
-                if func(product_id):
-                    invalid_sum += product_id
+            invalid_sum += sum(self.invalid_ids(start, end, num_repeats))
 
         return invalid_sum
 
@@ -97,8 +124,7 @@ class Solution(SolutionBase):
         -------
             int: The total sum of invalid IDs for Part 1.
         """
-        check_func = partial(self.has_repeated_sequence, num_repeats=2)
-        return self.solve_part(data, check_func)
+        return self.solve_part(data, num_repeats=2)
 
     def part2(self, data: list[str]) -> int:
         """Calculate the sum of invalid IDs where a digit sequence is repeated at least twice.
@@ -114,4 +140,4 @@ class Solution(SolutionBase):
         -------
             int: The total sum of invalid IDs for Part 2.
         """
-        return self.solve_part(data, self.has_repeated_sequence)
+        return self.solve_part(data)
@@ -9,6 +9,9 @@ The module contains a Solution class that inherits from SolutionBase for
 extracting optimal digit sequences from power bank readings.
 """
 
+import numpy as np
+import numpy.typing as npt
+
 from aoc.models.base import SolutionBase
 
 
@@ -40,26 +43,57 @@ class Solution(SolutionBase):
             int: Maximum k-digit number that can be formed from the input digits
                 while preserving their original order
         """
-        digits = [int(char) for char in bank]
-        n = len(digits)
-        remove = n - k
-        stack: list[int] = []
+        remove = len(bank) - k
+        stack = bytearray()
 
-        for d in digits:
+        # ASCII digit codes sort like the digits themselves, so the stack works
+        # on the raw bytes and the kept digits are parsed back in one go.
+        for d in bank.encode("ascii"):
             while remove > 0 and stack and stack[-1] < d:
                 stack.pop()
                 remove -= 1
 
             stack.append(d)
 
-        if remove > 0:
-            stack = stack[:-remove]
+        return int(stack[:k] or b"0")
+
+    def sum_max_joltages(self, data: list[str], k: int) -> int:
+        """Sum the maximum k-digit joltages of all banks in one batch.
+
+        When every bank has the same length, the banks are stacked into a single
+        digit matrix and the greedy choice is made for all of them at once: the
+        `i`-th output digit is the leftmost maximum in the window that still
+        leaves room for the remaining `k - i - 1` digits. Banks of mixed length,
+        banks shorter than `k`, and `k` too large for one int64 value fall back to
+        `find_max_joltage` per bank. The per-bank values are summed as Python
+        ints, so the total cannot overflow.
+
+        Args:
+            data: List of power bank readings (digit strings)
+            k: Number of digits to select for each output value
+
+        Returns
+        -------
+            int: Sum of the maximum k-digit values from all readings
+        """
+        n = len(data[0]) if data else 0
+        if not 0 < k <= min(n, 18) or any(len(line) != n for line in data):
+            return sum(self.find_max_joltage(line, k) for line in data)
+
+        raw = np.frombuffer("".join(data).encode("ascii"), dtype=np.uint8).reshape(-1, n)
+        digits = raw.astype(np.int64) - 48
+        columns = np.arange(n)
+        rows = np.arange(len(data))
+        start = np.zeros(len(data), dtype=np.intp)
+        value: npt.NDArray[np.int64] = np.zeros(len(data), dtype=np.int64)
 
-        value = 0
-        for d in stack[:k]:
-            value = value * 10 + d
+        for i in range(k):
+            window = (columns >= start[:, None]) & (columns <= n - k + i)
+            pick = np.where(window, digits, -1).argmax(axis=1)
+            value = value * 10 + digits[rows, pick]
+            start = pick + 1
 
-        return value
+        return sum(value.tolist())
 
     def part1(self, data: list[str]) -> int:
         """Calculate sum of maximum 2-digit joltages from all power banks.
@@ -75,7 +109,7 @@ class Solution(SolutionBase):
         -------
             int: Sum of maximum 2-digit values from all readings
         """
-        return sum([self.find_max_joltage(line, 2) for line in data])
+        return self.sum_max_joltages(data, 2)
 
     def part2(self, data: list[str]) -> int:
         """Calculate sum of maximum 12-digit joltages from all power banks.
@@ -91,4 +125,4 @@ class Solution(SolutionBase):
         -------
             int: Sum of maximum 12-digit values from all readings
         """
-        return sum([self.find_max_joltage(line, 12) for line in data])
+        return self.sum_max_joltages(data, 12)
@@ -29,50 +29,52 @@ class Solution(SolutionBase):
     the total number of removed rolls.
     """
 
-    DIRECTIONS: ClassVar[list[tuple[int, int]]] = [
-        (-1, -1),  # up-left
-        (-1, 0),  # up
-        (-1, 1),  # up-right
-        (0, -1),  # left
-        (0, 1),  # right
-        (1, -1),  # down-left
-        (1, 0),  # down
-        (1, 1),  # down-right
-    ]
-
-    def find_accessible_rolls(
-        self, grid: list[list[str]], rows: int, cols: int
-    ) -> list[tuple[int, int]]:
-        """Find all accessible paper rolls in the current grid.
+    ROLL_BITS: ClassVar[dict[int, int]] = str.maketrans("@.", "10")
 
-        An accessible roll is one marked '@' with fewer than four adjacent '@' rolls.
+    def parse_grid(self, data: list[str]) -> tuple[int, int]:
+        """Pack the grid layout into a single integer bitmap.
+
+        Cell `(r, c)` maps to bit `r * stride + c`, where `stride` leaves one
+        empty guard column after every row so horizontal shifts never carry a
+        roll into the neighbouring row.
 
         Args:
-            grid: The current grid of paper rolls and empty spaces.
-            rows: The number of rows in the grid.
-            cols: The number of columns in the grid.
+            data: A list of strings representing the grid layout.
 
         Returns
         -------
-            list[tuple[int, int]]: A list of (row, col) coordinates for accessible rolls.
+            tuple[int, int]: Bitmap of roll positions and the row stride in bits.
         """
-        positions = []
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] != "@":
-                    continue
+        stride = len(data[0]) + 1
+        bits = "".join(row + "." for row in data).translate(self.ROLL_BITS)
+        return int(bits[::-1], 2), stride
 
-                count = 0
-                for dr, dc in self.DIRECTIONS:
-                    nr = r + dr
-                    nc = c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == "@":
-                        count += 1
+    def find_accessible_rolls(self, rolls: int, stride: int) -> int:
+        """Find all accessible paper rolls in the current grid.
 
-                if count < 4:
-                    positions.append((r, c))
+        An accessible roll is one marked '@' with fewer than four adjacent '@' rolls.
+        The eight neighbour bitmaps are shifted copies of `rolls`, and they are
+        summed for every cell at once with bit-sliced half adders: `ones` and
+        `twos` hold the low bits of each cell's count and `fours` latches once
+        it reaches four.
 
-        return positions
+        Args:
+            rolls: Bitmap of roll positions from `parse_grid`.
+            stride: Row stride of the bitmap in bits.
+
+        Returns
+        -------
+            int: Bitmap of accessible roll positions.
+        """
+        ones = twos = fours = 0
+        for shift in (1, stride - 1, stride, stride + 1):
+            for neighbors in (rolls << shift, rolls >> shift):
+                carry = ones & neighbors
+                ones ^= neighbors
+                fours |= twos & carry
+                twos ^= carry
+
+        return rolls & ~fours
 
     def part1(self, data: list[str]) -> int:
         """Count the number of paper rolls that are initially accessible.
@@ -87,17 +89,17 @@ class Solution(SolutionBase):
         -------
             int: The total number of initially accessible paper rolls.
         """
-        grid = [list(row) for row in data]
-        rows, cols = len(grid), len(grid[0])
-        return len(self.find_accessible_rolls(grid, rows, cols))
+        rolls, stride = self.parse_grid(data)
+        return self.find_accessible_rolls(rolls, stride).bit_count()
 
     def part2(self, data: list[str]) -> int:
         """Count the total number of rolls that can be removed.
 
         This method simulates the iterative removal of accessible paper rolls.
         In each step, it finds all accessible rolls, adds them to a total count,
-        removes them from the grid (by changing '@' to '.'), and then repeats
-        the process until no more rolls are accessible.
+        removes them from the grid, and then repeats the process until no more
+        rolls are accessible. Every step is a handful of whole-grid bitwise
+        operations.
 
         Args:
             data: A list of strings representing the initial grid layout.
@@ -106,16 +108,11 @@ class Solution(SolutionBase):
         -------
             int: The total number of paper rolls that can be removed.
         """
-        grid = [list(row) for row in data]
-        rows, cols = len(grid), len(grid[0])
-        positions = self.find_accessible_rolls(grid, rows, cols)
+        rolls, stride = self.parse_grid(data)
 
         count = 0
-        while (c := len(positions)) > 0:
-            count += c
-            for y, x in positions:
-                grid[y][x] = "."
-
-            positions = self.find_accessible_rolls(grid, rows, cols)
+        while accessible := self.find_accessible_rolls(rolls, stride):
+            count += accessible.bit_count()
+            rolls ^= accessible
 
         return count
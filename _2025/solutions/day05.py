@@ -13,6 +13,9 @@ implements logic for checking freshness and merging overlapping ranges.
 import re
 from typing import ClassVar
 
+import numpy as np
+import numpy.typing as npt
+
 from aoc.models.base import SolutionBase
 
 
@@ -28,13 +31,14 @@ class Solution(SolutionBase):
     interval merge algorithm to handle overlapping fresh ID ranges.
     """
 
-    REGEX: ClassVar[re.Pattern[str]] = re.compile(r"(\d+)-(\d+)$")
+    REGEX: ClassVar[re.Pattern[str]] = re.compile(r"(\d+)-(\d+)")
 
     def parse_data(self, data: str) -> tuple[list[tuple[int, int]], list[int]]:
         """Parse fresh ID ranges and available ingredient IDs from input.
 
         The input consists of a block of inclusive fresh ID ranges, a blank
-        line, and then a block of available ingredient IDs, one per line.
+        line, and then a block of available ingredient IDs, one per line. Each
+        range line must match the pattern in full.
 
         Args:
             data: Raw puzzle input as a single string
@@ -48,40 +52,53 @@ class Solution(SolutionBase):
         fresh, available = data.split("\n\n")
 
         ranges: list[tuple[int, int]] = []
-        for line in fresh.splitlines():
-            if not line:
-                continue
-
-            match = self.REGEX.search(line)
+        for line in fresh.split():
+            match = self.REGEX.fullmatch(line)
             if not match:
                 msg = f"Invalid ingredient range: {line}"
                 raise ValueError(msg)
 
-            start, end = int(match.group(1)), int(match.group(2))
-            ranges.append((start, end))
+            ranges.append((int(match[1]), int(match[2])))
 
-        return ranges, [int(x) for x in available.splitlines() if x]
+        return ranges, [int(x) for x in available.split()]
 
-    @staticmethod
-    def is_fresh(ingredient: int, interval: tuple[int, int]) -> bool:
-        """Check whether an ingredient ID is fresh for a single range.
+    def merge_ranges(
+        self, ranges: list[tuple[int, int]]
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Merge overlapping and adjacent ranges into disjoint sorted ranges.
+
+        The ranges are sorted by start with NumPy, and a running maximum of the
+        ends gives how far the ranges seen so far reach. A new merged range
+        begins wherever a start lies beyond that reach plus one, so the whole
+        merge is a handful of array operations.
 
         Args:
-            ingredient: Ingredient ID to check
-            interval: Inclusive range (start, end) for fresh IDs
+            ranges: Inclusive (start, end) ranges in any order
 
         Returns
         -------
-            bool: True if ingredient is within the range, False otherwise
+            tuple: Arrays of starts and ends of the disjoint inclusive ranges,
+                sorted by start
         """
-        start, end = interval
-        return start <= ingredient <= end
+        bounds = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+        bounds = bounds[bounds[:, 0].argsort(kind="stable")]
+        starts, ends = bounds[:, 0], bounds[:, 1]
+        if not len(starts):
+            return starts, ends
+
+        reach = np.maximum.accumulate(ends)
+        first = np.flatnonzero(np.concatenate(([True], starts[1:] > reach[:-1] + 1)))
+        last = np.append(first[1:] - 1, len(starts) - 1)
+        return starts[first], reach[last]
 
     def part1(self, data: str) -> int:
         """Count available ingredient IDs that are fresh.
 
         An ingredient ID is considered fresh if it falls into at least one
-        of the inclusive fresh ID ranges.
+        of the inclusive fresh ID ranges. The ranges are merged into disjoint
+        sorted ranges first, so a single binary search per ingredient finds the
+        only range that could contain it; `np.searchsorted` runs that search for
+        all ingredients at once.
 
         Args:
             data: Raw puzzle input as a single string
@@ -91,15 +108,15 @@ class Solution(SolutionBase):
             int: Number of available ingredient IDs that are fresh
         """
         ranges, ingredients = self.parse_data(data)
-        count = 0
+        starts, ends = self.merge_ranges(ranges)
+        if not len(starts):
+            return 0
 
-        for ingredient in ingredients:
-            for interval in ranges:
-                if self.is_fresh(ingredient, interval):
-                    count += 1
-                    break
+        ids = np.array(ingredients, dtype=np.int64)
 
-        return count
+        idx = np.searchsorted(starts, ids, side="right") - 1
+        fresh = (idx >= 0) & (ends[idx.clip(0)] >= ids)
+        return int(fresh.sum())
 
     def part2(self, data: str) -> int:
         """Count total number of distinct fresh ingredient IDs.
@@ -116,17 +133,5 @@ class Solution(SolutionBase):
             int: Total count of distinct ingredient IDs that are fresh
         """
         ranges, _ = self.parse_data(data)
-        ranges = sorted(ranges, key=lambda interval: interval[0])
-
-        count = 0
-        current_start, current_end = ranges[0]
-
-        for start, end in ranges[1:]:
-            if start <= current_end + 1:
-                current_end = max(current_end, end)
-            else:
-                count += current_end - current_start + 1
-                current_start, current_end = start, end
-
-        count += current_end - current_start + 1
-        return count
+        starts, ends = self.merge_ranges(ranges)
+        return int((ends - starts + 1).sum())
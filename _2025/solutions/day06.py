@@ -10,6 +10,9 @@ and evaluating these rotated math expressions.
 """
 
 import math
+import operator
+
+import numpy as np
 
 from aoc.models.base import SolutionBase
 
@@ -22,16 +25,17 @@ class Solution(SolutionBase):
     operators by column position. Part 2 handles rotated worksheets by parsing
     columns in reverse order.
 
-    Uses zip transposition to read columns vertically and dynamic expression
-    evaluation to compute results with both addition and multiplication operators.
+    Folds each row into per-problem running results for Part 1, and reads the
+    padded grid column-wise for Part 2, evaluating each problem directly with
+    addition or multiplication depending on its operator.
     """
 
     def part1(self, data: list[str]) -> int:
         """Evaluate compacted worksheet problems reading columns left-to-right.
 
-        Transposes the worksheet rows into columns, where each column represents
-        either a multi-digit number or an operator (+ or *). Evaluates each
-        vertical math problem using the operator in the final column.
+        Splits the operator row into one operator per problem, then folds each
+        number row into the running result of every problem in turn, starting
+        from each operator's identity. Rows are never transposed into columns.
 
         Args:
             data: List of worksheet rows as strings
@@ -40,22 +44,26 @@ class Solution(SolutionBase):
         -------
             int: Sum of all evaluated math problems from the worksheet
         """
-        cols = list(zip(*[row.strip().split() for row in data], strict=False))
-        score = 0
+        operators = [operator.mul if op == "*" else operator.add for op in data[-1].split()]
+        results = [int(op is operator.mul) for op in operators]
 
-        for group in cols:
-            nums, operator = group[:-1], group[-1]
-            score += eval(operator.join(nums))  # noqa: S307
+        for row in data[:-1]:
+            results = [
+                op(result, int(token))
+                for op, result, token in zip(operators, results, row.split(), strict=True)
+            ]
 
-        return score
+        return sum(results)
 
     def part2(self, data: str) -> int:
         """Evaluate rotated worksheet problems reading columns right-to-left.
 
-        Parses the worksheet by reversing each row first, then transposing to
-        read columns from right to left. Identifies blank columns as problem
-        separators and evaluates expressions where '*' means multiplication
-        and '+' means addition of all numbers in the problem.
+        Loads the padded worksheet into a NumPy byte grid. Each column's digits,
+        read top-to-bottom, form one number, and these are built for all
+        columns at once. Blank columns separate problems. Each problem is
+        evaluated with '*' meaning multiplication and '+' meaning addition of
+        all its numbers, so the right-to-left reading order does not change
+        the result.
 
         Args:
             data: Raw worksheet input as a single string
@@ -67,30 +75,27 @@ class Solution(SolutionBase):
         lines = data.rstrip("\n").splitlines()
 
         max_width = max(len(line) for line in lines)
-        lines = [line.ljust(max_width) for line in lines]
-
-        operators = []
-        problems = []
-        current_problem = []
-
-        for col in zip(*[line[::-1] for line in lines], strict=False):
-            if all(char == " " for char in col):
-                continue
-
-            digit_chars = [char for char in col[:-1] if char != " "]
-            has_digits = bool(digit_chars)
-
-            if has_digits:
-                current_problem.append(int("".join(digit_chars)))
-
-            if col[-1] != " ":
-                operators.append(col[-1])
-                problems.append(current_problem)
-                current_problem = []
-
-        return sum(
-            [
-                (math.prod(problem) if operator == "*" else sum(problem))
-                for operator, problem in zip(operators, problems, strict=False)
-            ]
-        )
+        grid = np.frombuffer(
+            "".join(line.ljust(max_width) for line in lines).encode(), dtype=np.uint8
+        ).reshape(len(lines), max_width)
+
+        # Read every column's digits top-to-bottom into a number in one pass per row
+        digits = grid[:-1].astype(np.int64) - ord("0")
+        is_digit = (digits >= 0) & (digits <= 9)
+        values = np.zeros(max_width, dtype=np.int64)
+        for row_digits, row_mask in zip(digits, is_digit, strict=True):
+            values = np.where(row_mask, values * 10 + row_digits, values)
+
+        # Problems are the column spans between all-blank separator columns
+        used = (grid != ord(" ")).any(axis=0)
+        bounds = np.flatnonzero(np.diff(np.concatenate(([False], used, [False]))))
+        has_number = is_digit.sum(axis=0) > 0
+        operators = grid[-1].tobytes().decode()
+
+        total = 0
+        for start, end in zip(bounds[::2].tolist(), bounds[1::2].tolist(), strict=True):
+            problem: list[int] = values[start:end][has_number[start:end]].tolist()
+            op_char = operators[start:end].strip()
+            total += math.prod(problem) if op_char == "*" else sum(problem)
+
+        return total
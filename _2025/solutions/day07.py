@@ -11,6 +11,11 @@ count how many splitters activate (Part 1) and how many distinct beam
 paths reach the bottom row (Part 2).
 """
 
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
 from aoc.models.base import SolutionBase
 
 
@@ -27,11 +32,25 @@ class Solution(SolutionBase):
     many distinct paths reach the bottom of the grid after all splitting.
     """
 
-    def find_start(self, grid: list[list[str]]) -> tuple[int, int]:
+    SPLITTER_BITS: ClassVar[dict[int, int]] = str.maketrans("^.S", "100")
+
+    def encode_grid(self, data: list[str]) -> npt.NDArray[np.uint8]:
+        """Encode the lab grid as a 2D array of byte codes.
+
+        Args:
+            data: List of strings representing the lab grid
+
+        Returns
+        -------
+            npt.NDArray[np.uint8]: Array of shape (rows, cols) holding each cell's byte
+        """
+        return np.frombuffer("".join(data).encode(), dtype=np.uint8).reshape(len(data), -1)
+
+    def find_start(self, grid: npt.NDArray[np.uint8]) -> tuple[int, int]:
         """Locate the starting cell 'S' in the grid.
 
         Args:
-            grid: 2D character grid of the laser lab
+            grid: Encoded 2D byte grid of the laser lab
 
         Returns
         -------
@@ -41,13 +60,24 @@ class Solution(SolutionBase):
         ------
             ValueError: If no 'S' cell is found in the grid
         """
-        for x, row in enumerate(grid):
-            for y, cell in enumerate(row):
-                if cell == "S":
-                    return (x, y)
+        xs, ys = np.nonzero(grid == ord("S"))
+        if xs.size == 0:
+            err_msg = "No start cell 'S' in the grid!"
+            raise ValueError(err_msg)
+
+        return (int(xs[0]), int(ys[0]))
+
+    def splitter_bits(self, row: str) -> int:
+        """Convert a grid row into a bitmap of its splitter columns.
+
+        Args:
+            row: A single row of the lab grid
 
-        err_msg = "No start cell 'S' in the grid!"
-        raise ValueError(err_msg)
+        Returns
+        -------
+            int: Bitmap with bit `c` set when column `c` holds a '^' splitter
+        """
+        return int(row.translate(self.SPLITTER_BITS)[::-1], 2)
 
     def part1(self, data: list[str]) -> int:
         """Count how many splitters are activated along a single beam front.
@@ -57,6 +87,9 @@ class Solution(SolutionBase):
         splitter is counted and the beam splits into two beams diagonally
         down-left and down-right for the next row.
 
+        The beam front is a bitmap with bit `c` set for a beam in column `c`,
+        so each row is a few whole-front bitwise operations.
+
         Args:
             data: List of strings representing the lab grid
 
@@ -64,38 +97,28 @@ class Solution(SolutionBase):
         -------
             int: Number of times splitters are activated across all rows
         """
-        grid = [list(row) for row in data]
-        start_row, start_col = self.find_start(grid)
+        start_row, start_col = self.find_start(self.encode_grid(data))
 
-        beams: set[int] = {start_col}
+        width_mask = (1 << len(data[0])) - 1
+        beams = 1 << start_col
         count = 0
-        last_row_idx = len(grid) - 1
 
-        current_row = start_row
-        while current_row < last_row_idx:
-            current_row += 1
-            next_beams: set[int] = set()
-
-            for col in beams:
-                cell = grid[current_row][col]
-                if cell == "^":
-                    next_beams.add(col - 1)
-                    next_beams.add(col + 1)
-                    count += 1
-                else:
-                    next_beams.add(col)
-
-            beams = next_beams
+        for row in data[start_row + 1 :]:
+            split = beams & self.splitter_bits(row)
+            count += split.bit_count()
+            beams = ((beams ^ split) | (split << 1) | (split >> 1)) & width_mask
 
         return count
 
     def part2(self, data: list[str]) -> int:
         """Count distinct beam paths that reach the bottom row.
 
-        Uses dynamic programming where dp[r][c] stores how many distinct
-        paths can reach cell (r, c). Paths start from the cell below 'S'
-        and propagate row-by-row, splitting at '^' cells into diagonal
-        positions.
+        Uses dynamic programming over a single row vector of path counts, one
+        entry per column. Paths start from the cell below 'S' and propagate
+        row-by-row: counts on '^' cells are shifted into both diagonal
+        neighbours with whole-row NumPy adds, and all other counts pass
+        straight down. Path counts grow exponentially with splitter depth, so
+        they are held as Python ints in an object array and never overflow.
 
         Args:
             data: List of strings representing the lab grid
@@ -104,33 +127,23 @@ class Solution(SolutionBase):
         -------
             int: Total number of distinct paths that reach the bottom row
         """
-        grid = [list(row) for row in data]
-        rows, cols = len(grid), len(grid[0])
-
-        start_row, start_col = self.find_start(grid)
-
-        dp = [[0] * cols for _ in range(rows)]
-
-        if start_row + 1 < rows:
-            dp[start_row + 1][start_col] = 1
-
-        for r in range(start_row + 1, rows - 1):
-            for c in range(cols):
-                if dp[r][c] == 0:
-                    continue
-
-                cell = grid[r][c]
-                if cell == ".":
-                    dp[r + 1][c] += dp[r][c]
-
-                elif cell == "^":
-                    if c - 1 >= 0:
-                        dp[r + 1][c - 1] += dp[r][c]
-
-                    if c + 1 < cols:
-                        dp[r + 1][c + 1] += dp[r][c]
-
-                else:
-                    dp[r + 1][c] += dp[r][c]
-
-        return sum(dp[rows - 1])
+        cells = self.encode_grid(data)
+        start_row, start_col = self.find_start(cells)
+
+        splitters = cells == ord("^")
+        counts = np.zeros(cells.shape[1], dtype=object)
+
+        if start_row + 1 < len(data):
+            counts[start_col] = 1
+
+        # Rows without splitters pass every count straight down, so only rows
+        # holding at least one splitter are visited, reusing one scratch row.
+        first, last = start_row + 1, len(data) - 1
+        split = np.empty_like(counts)
+        for r in np.flatnonzero(splitters[first:last].any(axis=1)) + first:
+            np.multiply(counts, splitters[r], out=split)
+            counts -= split
+            counts[:-1] += split[1:]
+            counts[1:] += split[:-1]
+
+        return int(counts.sum())
@@ -11,9 +11,13 @@ circuit merging and a Solution class that inherits from SolutionBase.
 """
 
 from dataclasses import dataclass
-import math
 from typing import Self
 
+import numpy as np
+import numpy.typing as npt
+from scipy.sparse import coo_array
+from scipy.sparse.csgraph import connected_components
+
 from aoc.models.base import SolutionBase
 
 
@@ -22,7 +26,7 @@ class DSU:
     """Disjoint set union structure for tracking junction box circuits.
 
     Maintains parent and component size arrays to efficiently perform
-    union-find operations with path compression and union by size for
+    union-find operations with path halving and union by size for
     optimal circuit merging.
     """
 
@@ -43,10 +47,10 @@ class DSU:
         return cls(parent=list(range(n)), size=[1] * n)
 
     def find(self, x: int) -> int:
-        """Find root representative of junction box x's circuit with path compression."""
-        while self.parent[x] != x:
-            self.parent[x] = self.parent[self.parent[x]]
-            x = self.parent[x]
+        """Find root representative of junction box x's circuit with path halving."""
+        parent = self.parent
+        while (up := parent[x]) != x:
+            parent[x] = x = parent[up]
 
         return x
 
@@ -78,42 +82,63 @@ class Solution(SolutionBase):
 
     This solution connects junction boxes in 3D space using strings of lights,
     always connecting the closest unconnected pair. Uses Kruskal's algorithm
-    approach with Euclidean distance sorting and DSU for cycle detection.
+    approach with squared-distance sorting and DSU for cycle detection.
 
     Part 1: After 1000 shortest connections (10 for examples), multiply sizes
     of the three largest circuits. Part 2: Connect until single circuit, return
     product of X-coordinates of final merge pair.
     """
 
-    def build_edges(self, boxes: list[list[int]]) -> list[tuple[float, int, int]]:
-        """Compute all pairwise Euclidean distances between junction boxes.
+    def build_edges(
+        self, boxes: npt.NDArray[np.int64], limit: int | None = None
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """Order all junction box pairs by increasing Euclidean distance.
+
+        Squared distances of all pairs are computed with whole-array NumPy
+        operations; squaring preserves the ordering, so no square roots are
+        taken. Pairs at equal distance keep their `(i, j)` enumeration order.
+        When only the closest pairs are needed, they are selected with a
+        partial partition and only those are sorted.
 
         Args:
-            boxes: List of 3D coordinates [x, y, z] for each junction box
+            boxes: Array with one [x, y, z] row per junction box
+            limit: Optional number of closest pairs to return; all pairs when `None`
 
         Returns
         -------
-            list[tuple[float, int, int]]: Sorted edges (distance, box_i, box_j)
+            tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: Parallel arrays of
+                box indices `(i, j)`, with `i < j`, sorted by distance
         """
-        N = len(boxes)  # noqa: N806
-        edges: list[tuple[float, int, int]] = []
-        for i in range(N):
-            for j in range(i + 1, N):
-                d = math.dist(boxes[i], boxes[j])
-                edges.append((d, i, j))
-
-        edges.sort(key=lambda e: e[0])
-        return edges
+        rows, cols = np.triu_indices(len(boxes), k=1)
+
+        # Exact integer squared distances, one coordinate axis at a time
+        dists = np.zeros(len(rows), dtype=np.int64)
+        for axis in boxes.T.copy():
+            delta = axis[rows] - axis[cols]
+            dists += delta * delta
+
+        # Fold each pair's enumeration index into its sort key so a plain sort
+        # of distinct integers breaks ties by index, like a stable argsort
+        num_pairs = len(dists)
+        if num_pairs and int(dists.max()) < np.iinfo(np.int64).max // num_pairs - 1:
+            keys = dists * num_pairs + np.arange(num_pairs, dtype=np.int64)
+            if limit is not None and limit < num_pairs:
+                keys = np.partition(keys, limit - 1)[:limit]
+            order = np.sort(keys) % num_pairs
+        else:
+            order = np.argsort(dists, kind="stable")[:limit]
+
+        return rows[order], cols[order]
 
     def find_largest_circuits(
         self,
-        boxes: list[list[int]],
+        boxes: npt.NDArray[np.int64],
         pairs_to_process: int,
     ) -> int:
         """Process shortest connections and return product of 3 largest circuits.
 
         Args:
-            boxes: List of 3D junction box coordinates
+            boxes: Array with one [x, y, z] row per junction box
             pairs_to_process: Number of shortest connections to make (1000 for real input)
 
         Returns
@@ -121,28 +146,22 @@ class Solution(SolutionBase):
             int: Product of sizes of three largest circuits after specified connections
         """
         N = len(boxes)  # noqa: N806
-        edges = self.build_edges(boxes)
-        dsu = DSU.with_n(N)
-
-        for processed_pairs, (_, u, v) in enumerate(edges, start=1):
-            dsu.union(u, v)
-            if processed_pairs == pairs_to_process:
-                break
+        rows, cols = self.build_edges(boxes, limit=pairs_to_process)
 
-        comp_sizes: dict[int, int] = {}
-        for i in range(N):
-            root = dsu.find(i)
-            comp_sizes[root] = comp_sizes.get(root, 0) + 1
+        # Which circuits the first connections form does not depend on their
+        # order, so the components are labelled in one compiled pass
+        graph = coo_array((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(N, N))
+        _, labels = connected_components(graph, directed=False)
 
-        sizes = sorted(comp_sizes.values(), reverse=True)
-        a, b, c = sizes[0], sizes[1], sizes[2]
+        sizes: list[int] = np.sort(np.bincount(labels))[-3:].tolist()
+        a, b, c = sizes
         return a * b * c
 
-    def last_merge_x_product(self, boxes: list[list[int]]) -> int:
+    def last_merge_x_product(self, boxes: npt.NDArray[np.int64]) -> int:
         """Return X-coordinate product of final pair forming single circuit.
 
         Args:
-            boxes: List of 3D junction box coordinates
+            boxes: Array with one [x, y, z] row per junction box
 
         Returns
         -------
@@ -153,20 +172,22 @@ class Solution(SolutionBase):
             ValueError: If boxes don't form a single connected circuit
         """
         N = len(boxes)  # noqa: N806
-        edges = self.build_edges(boxes)
+        rows, cols = self.build_edges(boxes)
         dsu = DSU.with_n(N)
 
         components = N
-        last_u: int | None = None
-        last_v: int | None = None
 
-        for _, u, v in edges:
-            if dsu.union(u, v):
-                components -= 1
-                last_u, last_v = u, v
-                if components == 1:
-                    x1, x2 = boxes[last_u][0], boxes[last_v][0]
-                    return x1 * x2
+        # The final merge usually comes long before the last pair, so pairs are
+        # unboxed into Python ints one batch at a time rather than all up front
+        batch = max(N, 1)
+        for start in range(0, len(rows), batch):
+            us = rows[start : start + batch].tolist()
+            vs = cols[start : start + batch].tolist()
+            for u, v in zip(us, vs, strict=True):
+                if dsu.union(u, v):
+                    components -= 1
+                    if components == 1:
+                        return int(boxes[u, 0]) * int(boxes[v, 0])
 
         err_msg = "Did not reach a single circuit"
         raise ValueError(err_msg)
@@ -183,7 +204,7 @@ class Solution(SolutionBase):
         -------
             int: Product of sizes of three largest circuits after cutoff
         """
-        boxes = [list(map(int, line.split(","))) for line in data]
+        boxes = np.loadtxt(data, delimiter=",", dtype=np.int64, ndmin=2)
         pairs = 10 if len(boxes) <= 20 else 1000
         return self.find_largest_circuits(boxes, pairs_to_process=pairs)
 
@@ -199,5 +220,5 @@ class Solution(SolutionBase):
         -------
             int: Product of X coordinates from final successful connection
         """
-        boxes = [list(map(int, line.split(","))) for line in data]
+        boxes = np.loadtxt(data, delimiter=",", dtype=np.int64, ndmin=2)
         return self.last_merge_x_product(boxes)
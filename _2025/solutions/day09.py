@@ -11,10 +11,13 @@ implements coordinate compression, flood fill, and rectangle validation
 to efficiently search the space of candidate rectangles.
 """
 
-from collections import deque
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
+import numpy.typing as npt
+from scipy.ndimage import label
+
 from aoc.models.base import SolutionBase
 
 
@@ -58,6 +61,53 @@ class CompressedTiles:
         return len(self.coords)
 
 
+@dataclass(frozen=True, slots=True)
+class Rectangles:
+    """Candidate rectangles spanned by pairs of red tiles, as parallel arrays.
+
+    Every pair of red tiles that differ in both x and y defines one candidate
+    rectangle with the two tiles as opposite corners. Bounds are inclusive and
+    given in compressed grid indices, while areas use the original coordinates.
+
+    Attributes
+    ----------
+    x_left:
+        Left boundary index of each rectangle.
+    x_right:
+        Right boundary index of each rectangle.
+    y_top:
+        Top boundary index of each rectangle.
+    y_bottom:
+        Bottom boundary index of each rectangle.
+    areas:
+        Inclusive area of each rectangle on the original tile grid.
+    """
+
+    x_left: npt.NDArray[np.intp]
+    x_right: npt.NDArray[np.intp]
+    y_top: npt.NDArray[np.intp]
+    y_bottom: npt.NDArray[np.intp]
+    areas: npt.NDArray[np.int64]
+
+    def take(self, index: npt.NDArray[np.intp]) -> "Rectangles":
+        """Return the rectangles at the given positions, in that order.
+
+        Args:
+            index: Positions of the rectangles to keep.
+
+        Returns
+        -------
+            Rectangles: A new set holding only the selected rectangles.
+        """
+        return Rectangles(
+            self.x_left[index],
+            self.x_right[index],
+            self.y_top[index],
+            self.y_bottom[index],
+            self.areas[index],
+        )
+
+
 class Solution(SolutionBase):
     """Find largest valid rectangles in a movie theater tile grid.
 
@@ -69,18 +119,22 @@ class Solution(SolutionBase):
     red or green tiles.
 
     Coordinate compression is used to keep the grid small, and a brute-force
-    rectangle search is combined with a grid mask to validate candidate areas.
+    rectangle search is combined with a summed-area table of the grid mask to
+    validate candidate areas in constant time.
     """
 
-    DIRECTIONS: ClassVar[tuple[tuple[int, int], ...]] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    BATCH_SIZE: ClassVar[int] = 4096
+    STRUCTURE: ClassVar[npt.NDArray[np.bool_]] = np.array(
+        [[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=np.bool_
+    )
 
     def parse_data(self, data: list[str]) -> CompressedTiles:
         r"""Parse input lines and build a coordinate-compressed tile set.
 
         Each input line contains an integer coordinate pair in the form \"X,Y\".
-        This method extracts all red tile positions, builds the sorted unique
-        x- and y-coordinate lists, and converts each coordinate into its
-        corresponding compressed index pair.
+        This method parses all red tile positions into one integer array, builds
+        the sorted unique x- and y-coordinate lists, and converts each coordinate
+        into its compressed index pair with a vectorized binary search.
 
         Args:
             data: List of \"X,Y\" strings representing red tile positions.
@@ -89,40 +143,25 @@ class Solution(SolutionBase):
         -------
             CompressedTiles: Compressed coordinate lists and red tile indices.
         """
-        tiles = [tuple(map(int, line.split(","))) for line in data if line.strip()]
-
-        xs = sorted({x for x, _ in tiles})
-        ys = sorted({y for _, y in tiles})
+        if not data:
+            points = np.empty((0, 2), dtype=np.int64)
+        else:
+            points = np.loadtxt(data, delimiter=",", dtype=np.int64, ndmin=2)
 
-        x_to_idx = {x: i for i, x in enumerate(xs)}
-        y_to_idx = {y: i for i, y in enumerate(ys)}
+        xs = np.unique(points[:, 0])
+        ys = np.unique(points[:, 1])
 
-        coords = [(x_to_idx[x], y_to_idx[y]) for x, y in tiles]
-        return CompressedTiles(xs=xs, ys=ys, coords=coords)
+        x_idx = np.searchsorted(xs, points[:, 0])
+        y_idx = np.searchsorted(ys, points[:, 1])
 
-    def calculate_area(self, x1: int, y1: int, x2: int, y2: int) -> int:
-        r"""Compute the inclusive area of an axis-aligned rectangle on the input grid.
+        coords = list(zip(x_idx.tolist(), y_idx.tolist(), strict=True))
+        return CompressedTiles(xs=xs.tolist(), ys=ys.tolist(), coords=coords)
 
-        The rectangle is defined by two opposite corners (x1, y1) and (x2, y2),
-        and includes both boundary lines (hence the +1 in each dimension).
+    def construct_grid(self, height: int, width: int, value: int = 0) -> npt.NDArray[np.uint8]:
+        """Construct a byte grid initialized to a constant value.
 
-        Args:
-            x1: X-coordinate of the first corner.
-            y1: Y-coordinate of the first corner.
-            x2: X-coordinate of the opposite corner.
-            y2: Y-coordinate of the opposite corner.
-
-        Returns
-        -------
-            int: Inclusive rectangle area \( (|x2-x1|+1) * (|y2-y1|+1) \).
-        """
-        return (abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
-
-    def construct_grid(self, height: int, width: int, value: int = 0) -> list[list[int]]:
-        """Construct an integer grid initialized to a constant value.
-
-        This grid is used as a compact mask over the compressed coordinate
-        space. Cell values are interpreted as:
+        This grid is used as a compact, contiguous mask over the compressed
+        coordinate space. Cell values are interpreted as:
         - 0: empty
         - 1: red tile
         - 2: green tile (boundary or filled interior)
@@ -134,51 +173,36 @@ class Solution(SolutionBase):
 
         Returns
         -------
-            list[list[int]]: A height x width integer grid.
-        """
-        return [[value] * width for _ in range(height)]
-
-    def construct_bool_grid(
-        self, height: int, width: int, *, value: bool = False
-    ) -> list[list[bool]]:
-        """Construct a boolean grid initialized to a constant value.
-
-        This is used for marking reachability during flood fill (e.g. which
-        empty cells are reachable from the exterior boundary).
-
-        Args:
-            height: Number of rows.
-            width: Number of columns.
-            value: Initial boolean value for all cells.
-
-        Returns
-        -------
-            list[list[bool]]: A height x width boolean grid.
+            npt.NDArray[np.uint8]: A height x width byte grid.
         """
-        return [[value] * width for _ in range(height)]
+        return np.full((height, width), value, dtype=np.uint8)
 
-    def mark_red_tiles(self, grid: list[list[int]], coords: list[tuple[int, int]]) -> None:
+    def mark_red_tiles(self, grid: npt.NDArray[np.uint8], coords: list[tuple[int, int]]) -> None:
         """Mark red tiles on the compressed grid.
 
-        Sets grid cells corresponding to red tile coordinates to 1.
+        Sets grid cells corresponding to red tile coordinates to 1 with a
+        single fancy-indexed assignment.
 
         Args:
-            grid: Integer grid to modify in-place.
+            grid: Byte grid to modify in-place.
             coords: List of (x_idx, y_idx) red tile positions in compressed space.
         """
-        for x_idx, y_idx in coords:
-            grid[y_idx][x_idx] = 1
+        x_idx, y_idx = np.asarray(coords, dtype=np.intp).reshape(len(coords), 2).T
+        grid[y_idx, x_idx] = 1
 
-    def mark_green_boundary(self, grid: list[list[int]], coords: list[tuple[int, int]]) -> None:
+    def mark_green_boundary(
+        self, grid: npt.NDArray[np.uint8], coords: list[tuple[int, int]]
+    ) -> None:
         """Trace the loop edges between red tiles and mark boundary tiles as green.
 
         The input red tiles are treated as vertices of a closed polygonal loop
         in the given order. Consecutive tiles (including last->first) must be
         axis-aligned. Any empty grid cells along these connecting segments are
-        marked as green (2), leaving red cells intact.
+        marked as green (2), leaving red cells intact; each segment is a single
+        masked write through a view of its row or column.
 
         Args:
-            grid: Integer grid to modify in-place.
+            grid: Byte grid to modify in-place.
             coords: List of (x_idx, y_idx) red tile positions in loop order.
 
         Raises
@@ -192,148 +216,166 @@ class Solution(SolutionBase):
 
             if x1 == x2:
                 y_min, y_max = sorted((y1, y2))
-                for y in range(y_min, y_max + 1):
-                    if grid[y][x1] == 0:
-                        grid[y][x1] = 2
+                segment = grid[y_min : y_max + 1, x1]
 
             elif y1 == y2:
                 x_min, x_max = sorted((x1, x2))
-                for x in range(x_min, x_max + 1):
-                    if grid[y1][x] == 0:
-                        grid[y1][x] = 2
+                segment = grid[y1, x_min : x_max + 1]
 
             else:
                 err_msg = "Non axis-aligned segment in input"
                 raise ValueError(err_msg)
 
-    def seed_if_outside_empty(
-        self,
-        grid: list[list[int]],
-        outside: list[list[bool]],
-        queue: deque[tuple[int, int]],
-        x: int,
-        y: int,
-    ) -> None:
-        """Seed the flood fill queue with an exterior empty cell if eligible.
-
-        This helper is used to initialize the outside flood fill from boundary
-        positions. A cell is added if it is empty (0) and has not already been
-        marked as outside.
-
-        Args:
-            grid: Integer grid containing tile markings.
-            outside: Boolean grid marking cells known to be reachable from outside.
-            queue: Flood fill queue of (x, y) positions to explore.
-            x: Column index to check.
-            y: Row index to check.
-        """
-        if grid[y][x] == 0 and not outside[y][x]:
-            outside[y][x] = True
-            queue.append((x, y))
+            segment[segment == 0] = 2
 
-    def flood_fill_outside_zeros(self, grid: list[list[int]]) -> list[list[bool]]:
+    def flood_fill_outside_zeros(self, grid: npt.NDArray[np.uint8]) -> npt.NDArray[np.bool_]:
         """Mark all empty cells reachable from the grid boundary.
 
-        This performs a BFS flood fill over cells with value 0, starting from
-        all boundary positions. The result is a boolean mask indicating which
+        The empty (0) cells are split into 4-connected components with one
+        `scipy.ndimage.label` pass, and every component touching the grid
+        boundary is outside. The result is a boolean mask indicating which
         empty cells are connected to the exterior and therefore not part of the
         enclosed interior.
 
         Args:
-            grid: Integer grid where 0 denotes empty and non-zero denotes blocked.
+            grid: Byte grid where 0 denotes empty and non-zero denotes blocked.
 
         Returns
         -------
-            list[list[bool]]: Boolean grid where True indicates an outside-reachable empty cell.
+            npt.NDArray[np.bool_]: Boolean grid where True indicates an outside-reachable
+                empty cell.
         """
-        height = len(grid)
-        width = len(grid[0])
-
-        outside = self.construct_bool_grid(height, width, value=False)
-        queue: deque[tuple[int, int]] = deque()
-
-        for x in range(width):
-            self.seed_if_outside_empty(grid, outside, queue, x, 0)
-            self.seed_if_outside_empty(grid, outside, queue, x, height - 1)
-
-        for y in range(height):
-            self.seed_if_outside_empty(grid, outside, queue, 0, y)
-            self.seed_if_outside_empty(grid, outside, queue, width - 1, y)
-
-        while queue:
-            x, y = queue.popleft()
-            for dx, dy in self.DIRECTIONS:
-                nx, ny = x + dx, y + dy
-                if (
-                    nx in range(width)
-                    and ny in range(height)
-                    and not outside[ny][nx]
-                    and grid[ny][nx] == 0
-                ):
-                    outside[ny][nx] = True
-                    queue.append((nx, ny))
+        components, _ = label(grid == 0, structure=self.STRUCTURE)
+        border = np.concatenate(
+            (components[0], components[-1], components[:, 0], components[:, -1])
+        )
 
+        outside: npt.NDArray[np.bool_] = np.isin(components, border[border != 0])
         return outside
 
-    def fill_interior_as_green(self, grid: list[list[int]], outside: list[list[bool]]) -> None:
+    def fill_interior_as_green(
+        self, grid: npt.NDArray[np.uint8], outside: npt.NDArray[np.bool_]
+    ) -> None:
         """Convert enclosed empty cells into green tiles.
 
         After flood-filling the outside, any remaining empty (0) cells that are
         not marked outside are interior to the loop. These are re-labeled as
-        green (2) in-place.
+        green (2) in-place with a single masked assignment.
 
         Args:
-            grid: Integer grid to modify in-place.
+            grid: Byte grid to modify in-place.
             outside: Boolean grid marking which empty cells are reachable from outside.
         """
-        height = len(grid)
-        width = len(grid[0])
+        grid[(grid == 0) & ~outside] = 2
 
-        for y in range(height):
-            for x in range(width):
-                if grid[y][x] == 0 and not outside[y][x]:
-                    grid[y][x] = 2
+    def candidate_rectangles(self, tiles: CompressedTiles) -> Rectangles:
+        """Enumerate every red-corner rectangle at once with NumPy.
 
-    def rectangle_all_non_zero(
-        self,
-        grid: list[list[int]],
-        x_left: int,
-        x_right: int,
-        y_top: int,
-        y_bottom: int,
-    ) -> bool:
-        """Check whether a rectangle contains no empty cells.
-
-        The rectangle bounds are inclusive and are expressed in compressed grid
-        indices. A rectangle is valid if every cell within the bounds is
-        non-zero (i.e. red or green).
+        All red tile pairs are formed from the upper-triangle index pairs, the
+        pairs sharing a row or column are dropped, and the bounds and areas of
+        the rest are computed as whole arrays.
 
         Args:
-            grid: Integer grid containing 0 for empty and non-zero for occupied.
-            x_left: Left boundary (inclusive) in x index space.
-            x_right: Right boundary (inclusive) in x index space.
-            y_top: Top boundary (inclusive) in y index space.
-            y_bottom: Bottom boundary (inclusive) in y index space.
+            tiles: Compressed coordinate lists and red tile indices.
 
         Returns
         -------
-            bool: True if all cells in the rectangle are non-zero, otherwise False.
+            Rectangles: Bounds and areas of all candidate rectangles.
         """
-        for y in range(y_top, y_bottom + 1):
-            row = grid[y]
-            for x in range(x_left, x_right + 1):
-                if row[x] == 0:
-                    return False
+        coords = np.asarray(tiles.coords, dtype=np.intp).reshape(tiles.N, 2)
+        first, second = np.triu_indices(tiles.N, k=1)
+        a, b = coords[first], coords[second]
+        keep = (a[:, 0] != b[:, 0]) & (a[:, 1] != b[:, 1])
+        a, b = a[keep], b[keep]
+
+        x_left, x_right = np.minimum(a[:, 0], b[:, 0]), np.maximum(a[:, 0], b[:, 0])
+        y_top, y_bottom = np.minimum(a[:, 1], b[:, 1]), np.maximum(a[:, 1], b[:, 1])
+
+        xs = np.asarray(tiles.xs, dtype=np.int64)
+        ys = np.asarray(tiles.ys, dtype=np.int64)
+        areas = (xs[x_right] - xs[x_left] + 1) * (ys[y_bottom] - ys[y_top] + 1)
+        return Rectangles(x_left, x_right, y_top, y_bottom, areas)
+
+    def pareto_front(self, coords: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+        """Find the points not dominated towards the lower-left corner.
+
+        A point is dominated when another point is at least as far left and at
+        least as far up. Sorting by x then y and keeping each point whose y is
+        strictly below every earlier point's y leaves the staircase of
+        non-dominated points, in O(N log N).
 
-        return True
+        Args:
+            coords: Array of (x, y) points, one per row.
+
+        Returns
+        -------
+            npt.NDArray[np.intp]: Row indices of the non-dominated points.
+        """
+        order = np.lexsort((coords[:, 1], coords[:, 0]))
+        ys = coords[order, 1]
+        keep = np.ones(len(order), dtype=np.bool_)
+        keep[1:] = ys[1:] < np.minimum.accumulate(ys)[:-1]
+        front: npt.NDArray[np.intp] = order[keep]
+        return front
+
+    def build_occupied_table(self, grid: npt.NDArray[np.uint8]) -> npt.NDArray[np.int64]:
+        """Build a summed-area table counting the non-zero cells of the grid.
+
+        Entry `[y, x]` holds the number of non-zero cells in the sub-grid of
+        rows `0..y-1` and columns `0..x-1`, so the table has one extra leading
+        row and column of zeros and any rectangle's count takes four lookups.
+
+        Args:
+            grid: Byte grid containing 0 for empty and non-zero for occupied.
+
+        Returns
+        -------
+            npt.NDArray[np.int64]: A (height + 1) x (width + 1) summed-area table.
+        """
+        table = np.zeros((grid.shape[0] + 1, grid.shape[1] + 1), dtype=np.int64)
+        table[1:, 1:] = (grid != 0).cumsum(axis=0).cumsum(axis=1)
+        return table
+
+    def rectangle_all_non_zero(
+        self, table: npt.NDArray[np.int64], rectangles: Rectangles
+    ) -> npt.NDArray[np.bool_]:
+        """Check which rectangles contain no empty cells.
+
+        A rectangle is valid if every cell within its inclusive bounds is
+        non-zero (i.e. red or green), which holds exactly when its count of
+        non-zero cells in the summed-area table equals its cell count. The
+        four corner lookups are gathered for all rectangles at once.
+
+        Args:
+            table: Summed-area table of non-zero cells from `build_occupied_table`.
+            rectangles: Candidate rectangles to check.
+
+        Returns
+        -------
+            npt.NDArray[np.bool_]: True for each rectangle whose cells are all non-zero.
+        """
+        left, right = rectangles.x_left, rectangles.x_right + 1
+        top, bottom = rectangles.y_top, rectangles.y_bottom + 1
+        occupied = table[bottom, right] - table[top, right] - table[bottom, left] + table[top, left]
+        valid: npt.NDArray[np.bool_] = occupied == (right - left) * (bottom - top)
+        return valid
 
     def part1(self, data: list[str]) -> int:
         r"""Find largest rectangle area using two red tiles as opposite corners.
 
-        For every pair of red tiles that differ in both x and y, this method
-        computes the area of the axis-aligned rectangle they define and tracks
-        the maximum. The actual grid size does not matter due to the use of
-        red tile coordinates only.
+        For pairs of red tiles that differ in both x and y, this method
+        computes the area of the axis-aligned rectangle they define and takes
+        the maximum. The actual grid size does not matter due to the use of red
+        tile coordinates only.
+
+        Moving a corner further out never shrinks a rectangle, so a best pair
+        always has both corners on the outer staircases of the tile set: the
+        lower-left front against the upper-right front, and the upper-left
+        front against the lower-right front. Only those pairs are compared.
+
+        No rectangle can exceed the bounding box of all red tiles, so when two
+        red tiles sit on opposite corners of that box its area is returned
+        without enumerating any pairs.
 
         Args:
             data: List of \"X,Y\" strings representing red tile positions
@@ -344,25 +386,27 @@ class Solution(SolutionBase):
         """
         tiles = self.parse_data(data)
 
-        if tiles.N < 2:
-            return 0
+        if tiles.width > 1 and tiles.height > 1:
+            red = set(tiles.coords)
+            right, bottom = tiles.width - 1, tiles.height - 1
+            if {(0, 0), (right, bottom)} <= red or {(0, bottom), (right, 0)} <= red:
+                return (tiles.xs[-1] - tiles.xs[0] + 1) * (tiles.ys[-1] - tiles.ys[0] + 1)
 
+        coords = np.asarray(tiles.coords, dtype=np.intp).reshape(tiles.N, 2)
+        xs = np.asarray(tiles.xs, dtype=np.int64)
+        ys = np.asarray(tiles.ys, dtype=np.int64)
         max_area = 0
-        N = tiles.N  # noqa: N806
-
-        for i in range(N):
-            x1_idx, y1_idx = tiles.coords[i]
-            for j in range(i + 1, N):
-                x2_idx, y2_idx = tiles.coords[j]
-                if x1_idx == x2_idx or y1_idx == y2_idx:
-                    continue
 
-                x1, y1 = tiles.xs[x1_idx], tiles.ys[y1_idx]
-                x2, y2 = tiles.xs[x2_idx], tiles.ys[y2_idx]
-                area = self.calculate_area(x1, y1, x2, y2)
+        for flip in (np.array([1, 1]), np.array([1, -1])):
+            near = coords[self.pareto_front(coords * flip)][:, None, :]
+            far = coords[self.pareto_front(coords * -flip)][None, :, :]
 
-                if area > max_area:
-                    max_area = area
+            keep = (near != far).all(axis=-1)
+            width = np.abs(xs[near[..., 0]] - xs[far[..., 0]]) + 1
+            height = np.abs(ys[near[..., 1]] - ys[far[..., 1]]) + 1
+            areas = (width * height)[keep]
+            if areas.size:
+                max_area = max(max_area, int(areas.max()))
 
         return max_area
 
@@ -373,9 +417,9 @@ class Solution(SolutionBase):
         segments forming a loop; these segments become green tiles. Then, a
         flood fill from the outside marks all empty tiles reachable from the
         boundary as \"outside\". Any remaining empty tiles inside the loop are
-        also marked green. Finally, the method checks all red-opposite-corner
-        rectangles and keeps the largest whose interior contains only red or
-        green tiles (no empty tiles).
+        also marked green. Finally, the method checks the red-opposite-corner
+        rectangles from largest to smallest area, in batches, and returns the
+        first whose interior contains only red or green tiles (no empty tiles).
 
         Args:
             data: List of \"X,Y\" strings representing red tile positions in loop order
@@ -397,27 +441,15 @@ class Solution(SolutionBase):
         outside = self.flood_fill_outside_zeros(grid)
         self.fill_interior_as_green(grid, outside)
 
-        max_area = 0
-        N = tiles.N  # noqa: N806
-
-        for i in range(N):
-            x1_idx, y1_idx = tiles.coords[i]
-            for j in range(i + 1, N):
-                x2_idx, y2_idx = tiles.coords[j]
-                if x1_idx == x2_idx or y1_idx == y2_idx:
-                    continue
-
-                x_left, x_right = sorted((x1_idx, x2_idx))
-                y_top, y_bottom = sorted((y1_idx, y2_idx))
-
-                if not self.rectangle_all_non_zero(grid, x_left, x_right, y_top, y_bottom):
-                    continue
+        rectangles = self.candidate_rectangles(tiles)
+        table = self.build_occupied_table(grid)
 
-                x1, y1 = tiles.xs[x1_idx], tiles.ys[y1_idx]
-                x2, y2 = tiles.xs[x2_idx], tiles.ys[y2_idx]
-                area = self.calculate_area(x1, y1, x2, y2)
+        # Validate largest-first in batches; the first valid one is the answer
+        by_area = np.argsort(rectangles.areas)[::-1]
+        for start in range(0, len(by_area), self.BATCH_SIZE):
+            batch = rectangles.take(by_area[start : start + self.BATCH_SIZE])
+            valid = np.flatnonzero(self.rectangle_all_non_zero(table, batch))
+            if valid.size:
+                return int(batch.areas[valid[0]])
 
-                if area > max_area:
-                    max_area = area
-
-        return max_area
+        return 0
@@ -11,7 +11,6 @@ Part 2 uses the same button sets but treats joltages as a linear system
 to satisfy numeric requirements for each machine.
 """
 
-from collections import deque
 import math
 import re
 from typing import ClassVar, cast
@@ -80,33 +79,27 @@ class Solution(SolutionBase):
 
         return square, parentheses, curly
 
-    def to_light_state(self, lights: list[str]) -> tuple[int, ...]:
-        """Convert a light pattern ('.'/'#') into a boolean tuple state."""
-        return tuple(ch == "#" for ch in lights)
+    def to_light_state(self, lights: list[str]) -> int:
+        """Convert a light pattern ('.'/'#') into a bitmask with bit `i` set for light `i` on."""
+        return sum(1 << idx for idx, ch in enumerate(lights) if ch == "#")
 
-    def apply_button(self, state: tuple[int, ...], button: tuple[int, ...]) -> tuple[int, ...]:
-        """Toggle a set of indicator lights according to a button wiring.
-
-        Args:
-            state: Current boolean light state as a tuple
-            button: Tuple of indices of lights to toggle
-
-        Returns
-        -------
-            tuple[int, ...]: New light state after pressing the button once
-        """
-        arr = list(state)
+    def to_button_mask(self, button: tuple[int, ...]) -> int:
+        """Convert a button wiring into a bitmask of the lights it toggles."""
+        mask = 0
         for idx in button:
-            arr[idx] = not arr[idx]
+            mask ^= 1 << idx
 
-        return tuple(arr)
+        return mask
 
     def min_presses_for_lights(self, lights: list[str], buttons: list[tuple[int, ...]]) -> int:
         """Compute minimum presses to reach target light pattern using BFS.
 
         Treats each distinct light state as a node in a graph and each button
-        press as an edge to a new state. Performs a breadth-first search from
-        the all-off state until the target pattern is reached.
+        press as an edge to a new state. States and buttons are integer
+        bitmasks, so a press is a single XOR. Since every press undoes itself,
+        the graph is undirected and the search runs from both ends at once:
+        one frontier grows from the all-off state and one from the target, a
+        whole level at a time on whichever side is smaller, until they meet.
 
         Args:
             lights: Target light diagram as list of '.' and '#'
@@ -121,45 +114,41 @@ class Solution(SolutionBase):
             ValueError: If the target pattern cannot be reached
         """
         goal = self.to_light_state(lights)
-        start: tuple[int, ...] = tuple(False for _ in goal)
+        if goal == 0:
+            return 0
 
-        q: deque[tuple[tuple[int, ...], int]] = deque()
-        q.append((start, 0))
-        visited: set[tuple[int, ...]] = set()
+        masks = [self.to_button_mask(btn) for btn in buttons]
 
-        while q:
-            curr, steps = q.popleft()
-            if curr == goal:
-                return steps
+        # Each side maps the states it has reached to their press counts
+        near, far = {0: 0}, {goal: 0}
+        near_front, far_front = [0], [goal]
 
-            if curr in visited:
-                continue
+        while near_front and far_front:
+            if len(near_front) > len(far_front):
+                near, far = far, near
+                near_front, far_front = far_front, near_front
 
-            visited.add(curr)
+            steps = near[near_front[0]] + 1
+            best: int | None = None
+            next_front: list[int] = []
 
-            for btn in buttons:
-                nxt = self.apply_button(curr, btn)
-                if nxt not in visited:
-                    q.append((nxt, steps + 1))
+            for curr in near_front:
+                for mask in masks:
+                    nxt = curr ^ mask
+                    if nxt in far and (best is None or steps + far[nxt] < best):
+                        best = steps + far[nxt]
 
-        err_msg = f"Unreachable lights pattern {lights} with given buttons"
-        raise ValueError(err_msg)
+                    if nxt not in near:
+                        near[nxt] = steps
+                        next_front.append(nxt)
 
-    def button_to_vector(self, button: tuple[int, ...], num_slots: int) -> list[int]:
-        """Convert a button wiring into a vector for the joltage equation system.
+            if best is not None:
+                return best
 
-        Args:
-            button: Tuple of indices affected by this button
-            num_slots: Length of the target joltage vector
+            near_front = next_front
 
-        Returns
-        -------
-            list[int]: Vector with 1s at affected indices and 0 otherwise
-        """
-        vec = [0] * num_slots
-        for idx in button:
-            vec[idx] = 1
-        return vec
+        err_msg = f"Unreachable lights pattern {lights} with given buttons"
+        raise ValueError(err_msg)
 
     def min_presses_for_machine(
         self,
@@ -171,6 +160,8 @@ class Solution(SolutionBase):
         Models each button as contributing a fixed amount to one or more joltage
         slots and solves a linear system with integrality constraints where
         the objective is to minimize the total number of button presses.
+        Duplicate wirings are dropped first, since any presses of one copy can
+        be moved onto another without changing the total.
 
         Args:
             buttons: List of button wirings as tuples of indices
@@ -187,6 +178,10 @@ class Solution(SolutionBase):
         if not target:
             return 0
 
+        # Buttons wired to the same slots are interchangeable, so one of each
+        # gives the same minimum with a smaller program
+        buttons = list({frozenset(btn): btn for btn in buttons}.values())
+
         N = len(buttons)  # noqa: N806
         num_jolt = len(target)
 
@@ -198,12 +193,15 @@ class Solution(SolutionBase):
             return 0
 
         # Objective: minimize total button presses
-        c = [1] * N
+        c = np.ones(N)
+
+        # Build equality constraints: sum(button_columns * presses) = target,
+        # filling each button's column of the float matrix the solver works on
+        A_eq = np.zeros((num_jolt, N))  # noqa: N806
+        for col, btn in enumerate(buttons):
+            A_eq[list(btn), col] = 1
 
-        # Build equality constraints: sum(button_vectors * presses) = target
-        A_eq_list = [self.button_to_vector(btn, num_jolt) for btn in buttons]  # noqa: N806
-        A_eq: npt.NDArray[np.int_] = np.transpose(A_eq_list)  # noqa: N806
-        b_eq = np.array(target, dtype=int)
+        b_eq = np.array(target, dtype=np.float64)
         integrality = np.ones(N, dtype=int)
 
         res = linprog(
@@ -211,6 +209,7 @@ class Solution(SolutionBase):
             A_eq=A_eq,
             b_eq=b_eq,
             integrality=integrality,
+            method="highs",
         )
 
         if not res.success:
@@ -7,8 +7,8 @@ paths exist between given endpoints, with optional requirements to
 visit specific devices along the way.
 
 The module contains a Solution class that inherits from SolutionBase
-and implements graph construction plus memoized depth-first search
-for efficient path counting.
+and implements graph construction plus an iterative path-counting
+dynamic program over the devices in reverse topological order.
 """
 
 import re
@@ -47,8 +47,9 @@ class Solution(SolutionBase):
             device names reachable via its outputs.
         """
         graph: dict[str, list[str]] = {}
+        findall = self.REGEX.findall
         for line in data:
-            tokens = re.findall(self.REGEX, line)
+            tokens = findall(line)
             if not tokens:
                 continue
 
@@ -57,75 +58,130 @@ class Solution(SolutionBase):
 
         return graph
 
-    def dfs(
+    def index_graph(self, graph: dict[str, list[str]]) -> tuple[dict[str, int], list[list[int]]]:
+        """Assign every device a small integer id and rewrite edges with ids.
+
+        Devices that only appear as outputs get ids too, with no outgoing
+        edges of their own.
+
+        Args:
+            graph: Adjacency list of the device network.
+
+        Returns
+        -------
+            tuple[dict[str, int], list[list[int]]]: Mapping from device name
+            to id, and the adjacency list indexed by id.
+        """
+        ids: dict[str, int] = {}
+        for node, outputs in graph.items():
+            ids.setdefault(node, len(ids))
+            for nxt in outputs:
+                ids.setdefault(nxt, len(ids))
+
+        adjacency: list[list[int]] = [[] for _ in ids]
+        for node, outputs in graph.items():
+            adjacency[ids[node]] = [ids[nxt] for nxt in outputs]
+
+        return ids, adjacency
+
+    def post_order(self, adjacency: list[list[int]], start: int, target: int) -> list[int]:
+        """List the devices reachable from start, each after all of its outputs.
+
+        Walks the graph with an explicit stack instead of recursion and does
+        not continue past `target`, since paths end there. On the acyclic
+        device graph this is a reverse topological order.
+
+        Args:
+            adjacency: Adjacency list indexed by device id.
+            start: Id of the device where paths begin.
+            target: Id of the device where paths end.
+
+        Returns
+        -------
+            list[int]: Reachable device ids, every device after its outputs.
+        """
+        order: list[int] = []
+        visited = {start}
+        stack = [(start, iter(adjacency[start] if start != target else ()))]
+
+        while stack:
+            node, children = stack[-1]
+            for nxt in children:
+                if nxt not in visited:
+                    visited.add(nxt)
+                    stack.append((nxt, iter(adjacency[nxt] if nxt != target else ())))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+
+        return order
+
+    def count_paths(
         self,
         graph: dict[str, list[str]],
-        node: str,
+        start: str,
         target: str,
-        cache: dict[tuple[str, bool, bool], int],
         *,
-        seen_dac: bool,
-        seen_fft: bool,
         require_both: bool,
     ) -> int:
-        """Count paths from current node to target with optional device constraints.
+        """Count paths from start to target with optional device constraints.
 
-        Uses a memoized depth-first search where the state includes the
-        current node and whether 'dac' and 'fft' have already been seen
-        along the current path.
+        Each device holds one row of four path counts, one per combination
+        of whether 'dac' and 'fft' had been seen on arriving there, so a
+        single pass over a device's outputs sums all four states at once.
+        Devices are visited in reverse topological order, so every output's
+        row is ready when it is needed, and no recursion is used.
 
         Args:
             graph: Adjacency list of the device network.
-            node: Current device name.
+            start: Device where paths begin.
             target: Destination device to reach (typically 'out').
-            cache: Memoization dictionary keyed by (node, seen_dac, seen_fft).
-            seen_dac: Whether 'dac' has been visited so far on this path.
-            seen_fft: Whether 'fft' has been visited so far on this path.
             require_both: If True, only count paths that have visited both
                 'dac' and 'fft' by the time they reach target.
 
         Returns
         -------
-            int: Number of valid paths from node to target for this state.
+            int: Number of valid paths from start to target.
         """
-        if node == "dac":
-            seen_dac = True
-
-        if node == "fft":
-            seen_fft = True
+        ids, adjacency = self.index_graph(graph)
+        if start not in ids or target not in ids:
+            return 1 if start == target and not require_both else 0
+
+        # Flag bits set on entering a device: 0b10 for 'dac', 0b01 for 'fft'
+        marks = [0] * len(ids)
+        for name, bit in (("dac", 0b10), ("fft", 0b01)):
+            if name in ids:
+                marks[ids[name]] = bit
+
+        target_id = ids[target]
+        reached = (0, 0, 0, 1) if require_both else (1, 1, 1, 1)
+
+        # arrivals[node][flags] counts the valid paths onward from node for a
+        # path arriving there with `flags`, after adding node's own mark
+        arrivals: list[tuple[int, int, int, int]] = [(0, 0, 0, 0)] * len(ids)
+
+        for node in self.post_order(adjacency, ids[start], target_id):
+            if node == target_id:
+                row = reached
+            else:
+                c0 = c1 = c2 = c3 = 0
+                for nxt in adjacency[node]:
+                    a0, a1, a2, a3 = arrivals[nxt]
+                    c0, c1, c2, c3 = c0 + a0, c1 + a1, c2 + a2, c3 + a3
+                row = (c0, c1, c2, c3)
 
-        state = (node, seen_dac, seen_fft)
-        if state in cache:
-            return cache[state]
+            mark = marks[node]
+            arrivals[node] = (row[mark], row[0b01 | mark], row[0b10 | mark], row[0b11])
 
-        if node == target:
-            if require_both:
-                cache[state] = 1 if (seen_dac and seen_fft) else 0
-            else:
-                cache[state] = 1
-            return cache[state]
-
-        total = 0
-        for nxt in graph.get(node, []):
-            total += self.dfs(
-                graph,
-                nxt,
-                target,
-                cache,
-                seen_dac=seen_dac,
-                seen_fft=seen_fft,
-                require_both=require_both,
-            )
-
-        cache[state] = total
-        return total
+        return arrivals[ids[start]][0]
 
     def part1(self, data: list[str]) -> int:
         """Count all paths from 'you' to 'out' in the reactor graph.
 
-        Builds the directed device graph from the input and then runs a
-        memoized DFS from 'you' to 'out', counting every distinct path
-        that data could follow through the devices.
+        Builds the directed device graph from the input and then counts,
+        from 'you' to 'out', every distinct path that data could follow
+        through the devices.
 
         Args:
             data: List of device connection lines.
@@ -135,16 +191,7 @@ class Solution(SolutionBase):
             int: Number of distinct paths from 'you' to 'out'.
         """
         graph = self.construct_graph(data)
-        cache: dict[tuple[str, bool, bool], int] = {}
-        return self.dfs(
-            graph,
-            "you",
-            "out",
-            cache,
-            seen_dac=False,
-            seen_fft=False,
-            require_both=False,
-        )
+        return self.count_paths(graph, "you", "out", require_both=False)
 
     def part2(self, data: list[str]) -> int:
         """Count paths from 'svr' to 'out' that pass through both 'dac' and 'fft'.
@@ -162,13 +209,4 @@ class Solution(SolutionBase):
             'dac' and 'fft'.
         """
         graph = self.construct_graph(data)
-        cache: dict[tuple[str, bool, bool], int] = {}
-        return self.dfs(
-            graph,
-            "svr",
-            "out",
-            cache,
-            seen_dac=False,
-            seen_fft=False,
-            require_both=True,
-        )
+        return self.count_paths(graph, "svr", "out", require_both=True)